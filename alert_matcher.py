@@ -4,24 +4,205 @@
 
 import os
 import json
+from bisect import bisect_left
 from datetime import datetime
+from string import Template
+
+# Preferred keyword-scan backends, fastest first: ahocorasick_rs (Rust,
+# no per-match Python callback and releases the GIL during the scan),
+# then pyahocorasick, then plain substring scans.
+try:
+    from ahocorasick_rs import AhoCorasick as _AhoCorasickRs
+except ImportError:
+    _AhoCorasickRs = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SUBSCRIPTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alert_subscriptions.json')
 
+# Badge colors by influence tier, shared by every alert email
+_TIER_COLORS = {'high': '#c53030', 'medium': '#d69e2e', 'emerging': '#38a169'}
+
+# Static shell of the alert email, compiled once — per-alert rendering only
+# substitutes the four dynamic values instead of re-interpolating ~2 KB of
+# fixed markup.
+_ALERT_HTML_TEMPLATE = Template('''<!DOCTYPE html>
+<html>
+<head><meta charset="UTF-8"></head>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background:#f5f7fa; padding:20px;">
+    <div style="max-width:600px; margin:0 auto; background:white; border-radius:12px; overflow:hidden; box-shadow:0 2px 8px rgba(0,0,0,0.1);">
+        <div style="background:linear-gradient(135deg, #553c9a 0%, #805ad5 100%); color:white; padding:24px; text-align:center;">
+            <h1 style="margin:0; font-size:22px;">Topic Alert</h1>
+            <p style="margin:8px 0 0 0; opacity:0.9; font-size:14px;">Science Podcast Monitor &mdash; $today</p>
+        </div>
+        <div style="padding:24px;">
+            <p style="color:#4a5568; font-size:15px; margin-bottom:20px;">
+                Hi $name, <strong>$n_episodes new episode$plural</strong>
+                matched your topic subscriptions:
+            </p>
+            $episodes_html
+            <p style="margin-top:20px;font-size:13px;color:#a0aec0;">
+                You're receiving this because of your keyword subscriptions.
+                To update your preferences, reply to this email.
+            </p>
+        </div>
+        <div style="background:#f8fafc; padding:16px; text-align:center; color:#718096; font-size:12px;">
+            Science Podcast Monitor | National Academies of Sciences, Engineering, and Medicine
+        </div>
+    </div>
+</body>
+</html>''')
+
+# Most recent keyword automaton, keyed by the keyword set it was built from,
+# so repeated pipeline runs with unchanged subscriptions skip the rebuild.
+_AUTOMATON_CACHE = {}
+
+# Character-bigram pre-filter for the same keyword set: if no bigram of any
+# keyword appears in the text, no keyword can appear either.
+_BIGRAM_CACHE = {}
+
+
+def _get_keyword_bigrams(all_keywords):
+    """Set of every 2-char bigram occurring in any keyword (cached)."""
+    key = frozenset(all_keywords)
+    bigrams = _BIGRAM_CACHE.get(key)
+    if bigrams is None:
+        bigrams = set()
+        for kw in all_keywords:
+            for i in range(len(kw) - 1):
+                bigrams.add(kw[i:i + 2])
+        _BIGRAM_CACHE.clear()  # keep at most one set around
+        _BIGRAM_CACHE[key] = bigrams
+    return bigrams
+
+
+def _get_keyword_automaton(all_keywords):
+    """
+    Build (or reuse) an Aho-Corasick automaton over a set of keywords.
+
+    Returns (automaton, patterns): patterns is the keyword list backing an
+    ahocorasick_rs automaton (needed to map match indexes back to
+    strings), or None for pyahocorasick, whose matches carry the keyword.
+    """
+    key = frozenset(all_keywords)
+    entry = _AUTOMATON_CACHE.get(key)
+    if entry is None:
+        if _AhoCorasickRs is not None:
+            patterns = list(key)
+            entry = (_AhoCorasickRs(patterns), patterns)
+        else:
+            automaton = ahocorasick.Automaton()
+            for kw in all_keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            entry = (automaton, None)
+        _AUTOMATON_CACHE.clear()  # keep at most one automaton around
+        _AUTOMATON_CACHE[key] = entry
+    return entry
+
+
+def _find_keywords(searchable, all_keywords):
+    """
+    Return the set of keywords that appear in the searchable text.
+
+    A single Aho-Corasick pass reports every matching keyword at once when
+    ahocorasick_rs or pyahocorasick is installed; otherwise falls back to
+    per-keyword substring scans.
+    """
+    if not all_keywords:
+        return set()
+
+    # Cheap bigram gate: a keyword can only appear if one of its bigrams
+    # does, so episodes with no overlap skip the automaton scan entirely.
+    # Texts that do match exit this check on an early hit. (Single-char
+    # keywords have no bigram, so they bypass the gate.)
+    if all(len(kw) >= 2 for kw in all_keywords):
+        bigrams = _get_keyword_bigrams(all_keywords)
+        if not any(searchable[i:i + 2] in bigrams for i in range(len(searchable) - 1)):
+            return set()
+
+    if _AhoCorasickRs is not None:
+        automaton, _ = _get_keyword_automaton(all_keywords)
+        # overlapping=True so nested keywords (e.g. "climate" inside
+        # "climate change") are all reported
+        return set(automaton.find_matches_as_strings(searchable, overlapping=True))
+    if ahocorasick is not None:
+        automaton, _ = _get_keyword_automaton(all_keywords)
+        return {kw for _, kw in automaton.iter(searchable)}
+    return {kw for kw in all_keywords if kw in searchable}
+
+
+def _find_keywords_batch(searchables, all_keywords):
+    """
+    Keyword hits for many texts in a single automaton traversal.
+
+    Concatenates the texts with a \\x01 sentinel (which never appears in a
+    keyword), scans once, and attributes each match back to its text by
+    offset. Falls back to per-text scans when no automaton backend is
+    installed.
+    """
+    if not searchables:
+        return []
+    if not all_keywords or (_AhoCorasickRs is None and ahocorasick is None):
+        return [_find_keywords(s, all_keywords) for s in searchables]
+
+    big = '\x01'.join(searchables)
+
+    # Exclusive end offset of each text within the concatenation
+    ends = []
+    pos = 0
+    for s in searchables:
+        pos += len(s)
+        ends.append(pos)
+        pos += 1  # sentinel
+
+    hits = [set() for _ in searchables]
+    automaton, patterns = _get_keyword_automaton(all_keywords)
+    if patterns is not None:
+        for pat_idx, _, end in automaton.find_matches_as_indexes(big, overlapping=True):
+            hits[bisect_left(ends, end)].add(patterns[pat_idx])
+    else:
+        for end_idx, kw in automaton.iter(big):
+            hits[bisect_left(ends, end_idx + 1)].add(kw)
+    return hits
+
+
+# Parsed subscriptions cached by file mtime — the file changes rarely,
+# so repeat pipeline runs skip the JSON parse entirely.
+_SUBSCRIPTIONS_CACHE = {'mtime': None, 'subscribers': []}
+
 
 def load_subscriptions():
-    """Load subscriber data from alert_subscriptions.json."""
-    if not os.path.exists(SUBSCRIPTIONS_FILE):
+    """Load subscriber data from alert_subscriptions.json (cached by mtime)."""
+    try:
+        mtime = os.stat(SUBSCRIPTIONS_FILE).st_mtime
+    except OSError:
         return []
 
+    if _SUBSCRIPTIONS_CACHE['mtime'] == mtime:
+        return _SUBSCRIPTIONS_CACHE['subscribers']
+
     try:
-        with open(SUBSCRIPTIONS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('subscribers', [])
-    except (json.JSONDecodeError, IOError):
+        with open(SUBSCRIPTIONS_FILE, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        subscribers = data.get('subscribers', [])
+    except (ValueError, IOError):
         return []
 
+    _SUBSCRIPTIONS_CACHE['mtime'] = mtime
+    _SUBSCRIPTIONS_CACHE['subscribers'] = subscribers
+    return subscribers
+
 
 def match_alerts(summaries):
     """
@@ -39,24 +220,41 @@ def match_alerts(summaries):
     if not active:
         return []
 
+    # Lowercase and strip each subscriber's keywords exactly once — the
+    # union scan and the per-subscriber intersections share the same
+    # frozensets.
+    sub_keyword_sets = [
+        frozenset(kw.lower().strip() for kw in sub.get('keywords', []) if kw.strip())
+        for sub in active
+    ]
+
+    # Union of every subscriber's keywords — one scan per episode finds all
+    # of them, then per-subscriber matching is a set intersection.
+    all_keywords = frozenset().union(*sub_keyword_sets)
+
+    # Searchable text and keyword hits depend only on the episode, so build
+    # them once instead of once per (subscriber, episode) pair. All texts
+    # go through the automaton in one batched traversal.
+    searchables = [
+        ' '.join([
+            summary.get('summary', ''),
+            ' '.join(summary.get('science_topics', [])),
+            ' '.join(summary.get('claims_to_note', [])),
+            ' '.join(summary.get('policy_relevance', [])),
+            summary.get('episode_title', ''),
+        ]).lower()
+        for summary in summaries
+    ]
+    episode_hits = _find_keywords_batch(searchables, all_keywords)
+
     alerts = []
-    for sub in active:
-        keywords = [kw.lower().strip() for kw in sub.get('keywords', []) if kw.strip()]
+    for sub, keywords in zip(active, sub_keyword_sets):
         if not keywords:
             continue
 
         matching_episodes = []
-        for summary in summaries:
-            # Build searchable text from episode
-            searchable = ' '.join([
-                summary.get('summary', ''),
-                ' '.join(summary.get('science_topics', [])),
-                ' '.join(summary.get('claims_to_note', [])),
-                ' '.join(summary.get('policy_relevance', [])),
-                summary.get('episode_title', ''),
-            ]).lower()
-
-            matched_kw = [kw for kw in keywords if kw in searchable]
+        for summary, hits in zip(summaries, episode_hits):
+            matched_kw = sorted(hits & keywords)
             if matched_kw:
                 matching_episodes.append({
                     'podcast_name': summary.get('podcast_name', ''),
@@ -92,11 +290,10 @@ def format_alert_html(alert):
     n_episodes = len(alert['matching_episodes'])
     name = alert.get('name', 'there')
 
-    episodes_html = ''
+    episode_parts = []
     for ep in alert['matching_episodes']:
         tier = ep.get('influence_tier', 'emerging')
-        tier_colors = {'high': '#c53030', 'medium': '#d69e2e', 'emerging': '#38a169'}
-        tier_bg = tier_colors.get(tier, '#718096')
+        tier_bg = _TIER_COLORS.get(tier, '#718096')
 
         keywords_html = ' '.join(
             f'<span style="background:#e9d8fd;color:#553c9a;padding:2px 8px;border-radius:12px;font-size:12px;">{kw}</span>'
@@ -108,7 +305,7 @@ def format_alert_html(alert):
             for t in ep.get('science_topics', [])[:5]
         )
 
-        episodes_html += f'''
+        episode_parts.append(f'''
         <div style="background:white;border-radius:8px;padding:16px;margin-bottom:12px;border-left:4px solid {tier_bg};">
             <span style="background:{tier_bg};color:white;padding:2px 8px;border-radius:4px;font-size:11px;font-weight:bold;">{tier.upper()} REACH</span>
             <h3 style="color:#2d3748;margin:8px 0 4px 0;">{ep["podcast_name"]}: {ep["episode_title"]}</h3>
@@ -119,42 +316,100 @@ def format_alert_html(alert):
             <div style="margin:4px 0;">
                 <span style="font-size:11px;color:#718096;font-weight:600;">TOPICS:</span> {topics_html}
             </div>
-        </div>'''
+        </div>''')
+
+    return _ALERT_HTML_TEMPLATE.substitute(
+        today=today,
+        name=name,
+        n_episodes=n_episodes,
+        plural="s" if n_episodes != 1 else "",
+        episodes_html=''.join(episode_parts),
+    )
+
+
+# Plain-text episode blocks cached by episode identity — subscribers
+# matching the same episode share the formatting work.
+_EPISODE_PLAIN_CACHE = {}
+
+
+def _episode_plain_block(ep):
+    """Plain-text block for one matched episode (cached per episode)."""
+    key = (ep.get('podcast_name', ''), ep.get('episode_title', ''), ep.get('published', ''))
+    block = _EPISODE_PLAIN_CACHE.get(key)
+    if block is None:
+        tier = ep.get('influence_tier', 'emerging').upper()
+        lines = [
+            f"[{tier} REACH] {ep.get('podcast_name', '')}: {ep.get('episode_title', '')}",
+            f"  {ep.get('summary', '')[:300]}",
+        ]
+        topics = ', '.join(ep.get('science_topics', [])[:5])
+        if topics:
+            lines.append(f"  Topics: {topics}")
+        block = '\n'.join(lines)
+        if len(_EPISODE_PLAIN_CACHE) > 256:
+            _EPISODE_PLAIN_CACHE.clear()
+        _EPISODE_PLAIN_CACHE[key] = block
+    return block
+
+
+def format_alert_plain_text(alert):
+    """
+    Format an alert email as plain text for a single subscriber.
+
+    Built directly from the episode data rather than converting the HTML
+    body — only the greeting and matched keywords vary per subscriber, so
+    the episode blocks come from a shared cache.
+    """
+    today = datetime.now().strftime('%B %d, %Y')
+    n_episodes = len(alert['matching_episodes'])
+    name = alert.get('name', 'there')
+
+    parts = [
+        f"Topic Alert - Science Podcast Monitor - {today}",
+        "",
+        f"Hi {name}, {n_episodes} new episode{'s' if n_episodes != 1 else ''} "
+        "matched your topic subscriptions:",
+        "",
+    ]
+    for ep in alert['matching_episodes']:
+        parts.append(_episode_plain_block(ep))
+        matched = ', '.join(ep.get('matched_keywords', []))
+        if matched:
+            parts.append(f"  Matched: {matched}")
+        parts.append("")
+
+    parts.append(
+        "You're receiving this because of your keyword subscriptions. "
+        "To update your preferences, reply to this email."
+    )
+    parts.append("Science Podcast Monitor | National Academies of Sciences, Engineering, and Medicine")
+    return '\n'.join(parts)
 
-    html = f'''<!DOCTYPE html>
-<html>
-<head><meta charset="UTF-8"></head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background:#f5f7fa; padding:20px;">
-    <div style="max-width:600px; margin:0 auto; background:white; border-radius:12px; overflow:hidden; box-shadow:0 2px 8px rgba(0,0,0,0.1);">
-        <div style="background:linear-gradient(135deg, #553c9a 0%, #805ad5 100%); color:white; padding:24px; text-align:center;">
-            <h1 style="margin:0; font-size:22px;">Topic Alert</h1>
-            <p style="margin:8px 0 0 0; opacity:0.9; font-size:14px;">Science Podcast Monitor &mdash; {today}</p>
-        </div>
-        <div style="padding:24px;">
-            <p style="color:#4a5568; font-size:15px; margin-bottom:20px;">
-                Hi {name}, <strong>{n_episodes} new episode{"s" if n_episodes != 1 else ""}</strong>
-                matched your topic subscriptions:
-            </p>
-            {episodes_html}
-            <p style="margin-top:20px;font-size:13px;color:#a0aec0;">
-                You're receiving this because of your keyword subscriptions.
-                To update your preferences, reply to this email.
-            </p>
-        </div>
-        <div style="background:#f8fafc; padding:16px; text-align:center; color:#718096; font-size:12px;">
-            Science Podcast Monitor | National Academies of Sciences, Engineering, and Medicine
-        </div>
-    </div>
-</body>
-</html>'''
 
-    return html
+def _build_alert_message(alert, config):
+    """Build the multipart alert email for one subscriber."""
+    from email.message import EmailMessage
+
+    n_eps = len(alert['matching_episodes'])
+
+    # EmailMessage builds the multipart/alternative structure in one shot,
+    # cheaper than assembling MIMEMultipart + MIMEText parts by hand
+    message = EmailMessage()
+    message['Subject'] = f'[Topic Alert] {n_eps} episode{"s" if n_eps != 1 else ""} matched your interests'
+    message['From'] = f"{config.get('sender_name', 'Science Podcast Monitor')} <{config['sender_email']}>"
+    message['To'] = alert['email']
+    message.set_content(format_alert_plain_text(alert))
+    message.add_alternative(format_alert_html(alert), subtype='html')
+    return message
 
 
 def send_alerts(alerts):
     """
     Send alert emails to all matching subscribers.
 
+    All alerts go out through one batched Gmail API request, so N
+    subscribers cost a single HTTP round trip instead of N.
+
     Args:
         alerts: list from match_alerts()
 
@@ -165,36 +420,22 @@ def send_alerts(alerts):
         return {'sent': 0, 'errors': []}
 
     try:
-        from email_sender import _get_gmail_service, _send_via_gmail, load_email_config, html_to_plain_text
-        from email.mime.text import MIMEText
-        from email.mime.multipart import MIMEMultipart
+        from email_sender import load_email_config, _send_many_via_gmail
     except ImportError as e:
         return {'sent': 0, 'errors': [f'Email imports failed: {e}']}
 
     config = load_email_config()
+    messages = [_build_alert_message(alert, config) for alert in alerts]
+    results = _send_many_via_gmail(messages)
+
     sent = 0
     errors = []
-
-    for alert in alerts:
-        try:
-            html = format_alert_html(alert)
-            n_eps = len(alert['matching_episodes'])
-
-            message = MIMEMultipart('alternative')
-            message['Subject'] = f'[Topic Alert] {n_eps} episode{"s" if n_eps != 1 else ""} matched your interests'
-            message['From'] = f"{config.get('sender_name', 'Science Podcast Monitor')} <{config['sender_email']}>"
-            message['To'] = alert['email']
-
-            message.attach(MIMEText(html_to_plain_text(html), 'plain'))
-            message.attach(MIMEText(html, 'html'))
-
-            result = _send_via_gmail(message)
-            if result.get('success'):
-                sent += 1
-                print(f"  [ALERT] Sent alert to {alert['email']} ({n_eps} matches)")
-            else:
-                errors.append(f"{alert['email']}: {result.get('message', 'unknown error')}")
-        except Exception as e:
-            errors.append(f"{alert['email']}: {e}")
+    for alert, result in zip(alerts, results):
+        if result.get('success'):
+            sent += 1
+            print(f"  [ALERT] Sent alert to {alert['email']} "
+                  f"({len(alert['matching_episodes'])} matches)")
+        else:
+            errors.append(f"{alert['email']}: {result.get('message', 'unknown error')}")
 
     return {'sent': sent, 'errors': errors}
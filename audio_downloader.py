@@ -3,12 +3,23 @@
 # Uses ffmpeg directly (not pydub) to avoid loading entire files into RAM
 
 import os
+import re
 import shutil
 import subprocess
 import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import MAX_AUDIO_FILE_SIZE_MB, COMPRESS_BITRATE
 
+# Shared session — episodes often come from the same CDN hosts, so
+# keep-alive avoids a TCP+TLS handshake per download
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
 
 def download_audio(audio_url, episode_id="episode"):
     """
@@ -22,7 +33,7 @@ def download_audio(audio_url, episode_id="episode"):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
         }
-        response = requests.get(audio_url, stream=True, timeout=300, headers=headers)
+        response = _SESSION.get(audio_url, stream=True, timeout=300, headers=headers)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"  [ERROR] Download failed: {e}")
@@ -55,6 +66,85 @@ def download_audio(audio_url, episode_id="episode"):
     return filepath
 
 
+def download_and_compress_audio(audio_url, episode_id="episode"):
+    """
+    Download and compress in one pass by streaming the response body into
+    ffmpeg's stdin. Only the compressed file touches disk, skipping the
+    intermediate raw download and its extra read/write pass.
+
+    Returns (path to compressed MP3, duration in seconds) — duration is
+    parsed from ffmpeg's own log so chunking doesn't need a separate
+    ffprobe run. Either value may be None on failure.
+    """
+    if not shutil.which('ffmpeg'):
+        # Fall back to the two-step path when ffmpeg is unavailable
+        filepath = download_audio(audio_url, episode_id)
+        return (compress_audio(filepath) if filepath else None), None
+
+    print(f"  Downloading audio (streaming into ffmpeg)...")
+
+    try:
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+        }
+        response = _SESSION.get(audio_url, stream=True, timeout=300, headers=headers)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"  [ERROR] Download failed: {e}")
+        return None, None
+
+    tmp_dir = tempfile.mkdtemp(prefix='spm_')
+    filepath = os.path.join(tmp_dir, f"{episode_id}.mp3")
+    stderr_path = filepath + '.ffmpeg.log'
+
+    try:
+        with open(stderr_path, 'wb') as errf:
+            proc = subprocess.Popen(
+                # 16 kHz mono is what Whisper resamples to anyway — encoding
+                # at that rate spends the whole bitrate budget on the band
+                # the model actually uses
+                ['ffmpeg', '-nostats', '-loglevel', 'info', '-i', 'pipe:0',
+                 '-ac', '1', '-ar', '16000', '-ab', COMPRESS_BITRATE, '-f', 'mp3', '-y', filepath],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=errf,
+            )
+            total_bytes = 0
+            # 64 KiB chunks keep the syscall count down on large files
+            for chunk in response.iter_content(chunk_size=65536):
+                proc.stdin.write(chunk)
+                total_bytes += len(chunk)
+            proc.stdin.close()
+            proc.wait(timeout=600)
+
+        with open(stderr_path, 'r', errors='replace') as errf:
+            ffmpeg_log = errf.read()
+
+        if proc.returncode != 0 or not os.path.exists(filepath):
+            print(f"  [ERROR] ffmpeg failed: {ffmpeg_log[-200:]}")
+            return None, None
+
+        duration = _parse_ffmpeg_duration(ffmpeg_log)
+        size_mb = os.path.getsize(filepath) / (1024 * 1024)
+        print(f"  Downloaded {total_bytes / (1024 * 1024):.1f} MB -> compressed {size_mb:.1f} MB")
+        return filepath, duration
+
+    except Exception as e:
+        print(f"  [ERROR] Streaming download failed: {e}")
+        return None, None
+    finally:
+        try:
+            os.remove(stderr_path)
+        except OSError:
+            pass
+
+
+def _parse_ffmpeg_duration(ffmpeg_log):
+    """Parse 'Duration: HH:MM:SS.ss' from ffmpeg's log output."""
+    match = re.search(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)', ffmpeg_log)
+    if not match:
+        return None
+    return int(match.group(1)) * 3600 + int(match.group(2)) * 60 + float(match.group(3))
+
+
 def _get_duration_seconds(filepath):
     """Get audio duration in seconds using ffprobe."""
     try:
@@ -89,7 +179,7 @@ def compress_audio(filepath, force=False):
     try:
         compressed_path = filepath.rsplit('.', 1)[0] + '_compressed.mp3'
         result = subprocess.run(
-            ['ffmpeg', '-i', filepath, '-ac', '1', '-ab', COMPRESS_BITRATE,
+            ['ffmpeg', '-i', filepath, '-ac', '1', '-ar', '16000', '-ab', COMPRESS_BITRATE,
              '-y', compressed_path],
             capture_output=True, text=True, timeout=600
         )
@@ -110,11 +200,18 @@ def compress_audio(filepath, force=False):
         return filepath
 
 
-def chunk_audio(filepath, chunk_minutes=15):
+def chunk_audio(filepath, chunk_minutes=15, stream_copy=False, duration=None):
     """
     Split audio file into time-based chunks using ffmpeg directly.
     Uses segment muxer to avoid loading entire file into RAM.
 
+    When stream_copy is True the input is already mono MP3 at the target
+    bitrate (as produced by our own compression step), so segments are
+    split with `-c copy` instead of paying for a second MP3 encode.
+
+    Callers that already know the duration in seconds can pass it to skip
+    the ffprobe run.
+
     Returns list of chunk file paths.
     """
     if not shutil.which('ffmpeg'):
@@ -122,7 +219,8 @@ def chunk_audio(filepath, chunk_minutes=15):
         return [filepath]
 
     try:
-        duration = _get_duration_seconds(filepath)
+        if duration is None:
+            duration = _get_duration_seconds(filepath)
         if duration is None:
             print("  [WARN] Could not determine duration, skipping chunking")
             return [filepath]
@@ -140,9 +238,14 @@ def chunk_audio(filepath, chunk_minutes=15):
         base = filepath.rsplit('.', 1)[0]
         pattern = f"{base}_chunk%03d.mp3"
 
+        if stream_copy:
+            codec_args = ['-c', 'copy', '-reset_timestamps', '1']
+        else:
+            codec_args = ['-ac', '1', '-ab', COMPRESS_BITRATE]
+
         result = subprocess.run(
-            ['ffmpeg', '-i', filepath, '-f', 'segment', '-segment_time', str(chunk_seconds),
-             '-ac', '1', '-ab', COMPRESS_BITRATE, '-y', pattern],
+            ['ffmpeg', '-i', filepath, '-f', 'segment', '-segment_time', str(chunk_seconds)]
+            + codec_args + ['-y', pattern],
             capture_output=True, text=True, timeout=600
         )
 
@@ -150,13 +253,11 @@ def chunk_audio(filepath, chunk_minutes=15):
             print(f"  [ERROR] Chunking failed: {result.stderr[-200:]}")
             return [filepath]
 
-        # Find the generated chunk files
-        chunk_dir = os.path.dirname(filepath)
-        chunk_base = os.path.basename(base) + '_chunk'
-        chunks = sorted([
-            os.path.join(chunk_dir, f) for f in os.listdir(chunk_dir)
-            if f.startswith(chunk_base) and f.endswith('.mp3')
-        ])
+        # Segment output names follow the deterministic %03d pattern, so
+        # construct them directly instead of scanning the directory
+        # (+1 covers the off-by-one when the duration estimate rounds down)
+        chunks = [f"{base}_chunk{i:03d}.mp3" for i in range(num_chunks + 1)]
+        chunks = [c for c in chunks if os.path.exists(c)]
 
         print(f"  Split into {len(chunks)} chunks")
         return chunks
@@ -172,14 +273,14 @@ def prepare_audio(audio_url, episode_id="episode"):
 
     Returns list of audio file paths ready for transcription.
     """
-    filepath = download_audio(audio_url, episode_id)
+    filepath, duration = download_and_compress_audio(audio_url, episode_id)
     if not filepath:
         return []
 
-    # Always compress large files
-    size_mb = os.path.getsize(filepath) / (1024 * 1024)
-    filepath = compress_audio(filepath, force=(size_mb > MAX_AUDIO_FILE_SIZE_MB))
-    chunks = chunk_audio(filepath)
+    # Our compression step already produced mono MP3 at the target bitrate,
+    # so chunking can split the stream without re-encoding; duration comes
+    # from the ffmpeg log, so no ffprobe run is needed
+    chunks = chunk_audio(filepath, stream_copy=True, duration=duration)
 
     return chunks
 
@@ -2,14 +2,30 @@
 # Monitor the Bluesky Science Feed for trending science discussions
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 from datetime import datetime, timedelta
+from operator import itemgetter
 from config import HISTORY_FILE
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
 # Bluesky public API (no auth needed for reading public data)
 PUBLIC_API = "https://public.api.bsky.app/xrpc"
 
+# Shared session — all calls hit one host, so keep-alive avoids a TCP+TLS
+# handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+
 # The Bluesky Science Feed — curated, verified scientists
 SCIENCE_FEED_URI = "at://did:plc:jfhpnnst6flqway4eaeqzj2a/app.bsky.feed.generator/for-science"
 
@@ -32,15 +48,17 @@ def get_feed_posts(feed_uri=None, limit=100):
     all_posts = []
     cursor = None
     pages = 0
-    max_pages = 4  # 4 pages x 30 = up to 120 posts
+    max_pages = 4  # safety cap; one 100-post page normally covers the limit
 
-    while pages < max_pages:
-        params = {"feed": feed_uri, "limit": 30}
+    while pages < max_pages and len(all_posts) < limit:
+        # 100 is the API's documented max page size — one large page replaces
+        # several 30-post round trips
+        params = {"feed": feed_uri, "limit": min(100, limit - len(all_posts))}
         if cursor:
             params["cursor"] = cursor
 
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 f"{PUBLIC_API}/app.bsky.feed.getFeed",
                 params=params,
                 timeout=15,
@@ -99,7 +117,7 @@ def get_feed_posts(feed_uri=None, limit=100):
 def get_profile(handle):
     """Get a Bluesky user's profile including follower count."""
     try:
-        response = requests.get(
+        response = _SESSION.get(
             f"{PUBLIC_API}/app.bsky.actor.getProfile",
             params={"actor": handle},
             timeout=10,
@@ -110,6 +128,26 @@ def get_profile(handle):
         return None
 
 
+def _parse_created_at(created_at):
+    """
+    Parse a post's createdAt timestamp to a naive UTC datetime.
+
+    Bluesky timestamps are a fixed "YYYY-MM-DDTHH:MM:SS[.sss]Z" layout, so
+    the common case slices straight into ints — much cheaper than
+    fromisoformat plus two string allocations. Uses ciso8601 when installed;
+    anything unusual falls back to fromisoformat.
+    """
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(created_at).replace(tzinfo=None)
+    try:
+        return datetime(
+            int(created_at[0:4]), int(created_at[5:7]), int(created_at[8:10]),
+            int(created_at[11:13]), int(created_at[14:16]), int(created_at[17:19]),
+        )
+    except (ValueError, IndexError):
+        return datetime.fromisoformat(created_at.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
 def filter_posts(posts, min_likes=None, min_reposts=None, hours_back=24):
     """
     Filter posts by engagement and recency.
@@ -122,25 +160,40 @@ def filter_posts(posts, min_likes=None, min_reposts=None, hours_back=24):
         min_reposts = MIN_REPOSTS
 
     cutoff = datetime.utcnow() - timedelta(hours=hours_back)
-    filtered = []
+    scored = []
 
     for post in posts:
+        # Check engagement first (either likes OR reposts meet threshold) —
+        # the cheap integer compare gates the costlier timestamp parse
+        if post["like_count"] < min_likes and post["repost_count"] < min_reposts:
+            continue
+
         # Check recency
         try:
-            post_time = datetime.fromisoformat(post["created_at"].replace("Z", "+00:00")).replace(tzinfo=None)
+            post_time = _parse_created_at(post["created_at"])
             if post_time < cutoff:
                 continue
         except (ValueError, KeyError):
             pass  # Keep posts with unparseable dates
 
-        # Check engagement (either likes OR reposts meet threshold)
-        if post["like_count"] >= min_likes or post["repost_count"] >= min_reposts:
-            filtered.append(post)
+        scored.append((post["like_count"] + post["repost_count"], post))
 
-    # Sort by total engagement
-    filtered.sort(key=lambda p: p["like_count"] + p["repost_count"], reverse=True)
+    # Sort by total engagement, precomputed above so the sort key is a plain
+    # tuple index rather than a per-comparison dict lookup
+    scored.sort(key=itemgetter(0), reverse=True)
 
-    return filtered
+    return [post for _, post in scored]
+
+
+def _format_post_for_llm(i, post):
+    """Format one post for the LLM prompt."""
+    text = post['text']
+    if len(text) > 500:  # only allocate a copy when truncation is needed
+        text = text[:500]
+    return (
+        f"[{i + 1}] @{post['author_handle']} ({post['followers_count']:,} followers, "
+        f"{post['like_count']} likes, {post['repost_count']} reposts):\n{text}"
+    )
 
 
 def summarize_bluesky_posts(posts):
@@ -159,16 +212,9 @@ def summarize_bluesky_posts(posts):
 
     from llm import ask_llm
 
-    # Format posts for the LLM
-    formatted = []
-    for i, post in enumerate(posts[:50]):  # Limit to 50 posts
-        formatted.append(
-            f"[{i+1}] @{post['author_handle']} ({post['followers_count']:,} followers, "
-            f"{post['like_count']} likes, {post['repost_count']} reposts):\n"
-            f"{post['text'][:500]}"
-        )
-
-    posts_text = "\n\n".join(formatted)
+    # Format posts for the LLM in one pass
+    selected = posts[:50]  # Limit to 50 posts
+    posts_text = "\n\n".join(_format_post_for_llm(i, p) for i, p in enumerate(selected))
 
     system_prompt = (
         "You are a science policy analyst at NASEM. Analyze Bluesky Science Feed posts "
@@ -176,7 +222,7 @@ def summarize_bluesky_posts(posts):
         "Respond ONLY with valid JSON. No markdown, no code fences."
     )
 
-    user_prompt = f"""Analyze these {len(formatted)} posts from the Bluesky Science Feed (collected {datetime.now().strftime('%B %d, %Y')}). Return a JSON object:
+    user_prompt = f"""Analyze these {len(selected)} posts from the Bluesky Science Feed (collected {datetime.now().strftime('%B %d, %Y')}). Return a JSON object:
 
 {{
   "trending_topics": [
@@ -198,7 +244,7 @@ Limit to top 5 trending topics, top 5 notable posts, top 3 NASEM-relevant items.
 POSTS:
 {posts_text}"""
 
-    print(f"  Summarizing {len(formatted)} Bluesky posts...")
+    print(f"  Summarizing {len(selected)} Bluesky posts...")
 
     response = ask_llm(user_prompt, system_prompt=system_prompt)
 
@@ -220,7 +266,7 @@ POSTS:
         }
 
     summary["post_count"] = len(posts)
-    summary["filtered_count"] = len(formatted)
+    summary["filtered_count"] = len(selected)
 
     topic_count = len(summary.get("trending_topics", []))
     print(f"  Identified {topic_count} trending topics from Bluesky")
@@ -32,6 +32,38 @@ LLM_MODELS = {
 
 LLM_MAX_TOKENS = 4096
 
+# On-disk cache for LLM responses — re-runs on the same day (after a
+# failure, or while iterating) reuse yesterday's answers instead of
+# paying for identical API calls again
+LLM_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'llm_cache.json')
+LLM_CACHE_TTL_HOURS = 24
+
+# Trend synthesis cache — keyed on the input topics/episodes themselves,
+# so a re-run with the same windows skips the LLM call even if prompt
+# formatting details change
+TREND_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'trend_cache.json')
+TREND_CACHE_TTL_HOURS = 24
+
+# NASEM topic-lookup cache — recurring topics ("climate change", "AI")
+# skip re-scanning the 1,300-publication catalog, both within a batch
+# and across daily runs
+NASEM_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'nasem_cache.json')
+NASEM_CACHE_TTL_HOURS = 24
+
+# Episode summary cache — keyed on the transcript text itself, so a
+# re-upload or backfill whose metadata changed (and therefore misses the
+# prompt-level LLM cache) still reuses the existing summary
+SUMMARY_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'summary_cache.json')
+SUMMARY_CACHE_TTL_HOURS = 24 * 7
+
+# Per-feed ETag / Last-Modified values for RSS conditional GETs —
+# unchanged feeds answer 304 instead of shipping the full document
+FEED_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'feed_cache.json')
+
+# Digest metadata cache — published digest files never change after they
+# are written, so manifest rebuilds reuse episode counts keyed by mtime
+DIGEST_INFO_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'digest_info_cache.json')
+
 # ======================
 # TRANSCRIPTION SETTINGS
 # ======================
@@ -1,10 +1,41 @@
 # digest_generator.py
 # Collate podcast summaries + Bluesky trends and generate meta-summary
 
+import hashlib
 import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from llm import ask_llm
-from influence_scorer import sort_by_influence
+from config import TREND_CACHE_FILE, TREND_CACHE_TTL_HOURS
+
+# llm and influence_scorer are imported inside the functions that need
+# them (the pattern bluesky_monitor uses) so importing this module stays
+# cheap for CLI paths that never generate a digest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional ```json ... ``` fences around an LLM response, stripped in one pass
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?```\s*$", re.DOTALL)
+
+# Caps on meta-summary prompt input — an unusually heavy day should not
+# push the prompt past the model context or into long-context pricing
+MAX_SUMMARY_CHARS = 800
+MAX_EPISODES_IN_PROMPT = 40
+
+
+def _parse_llm_json(response, fallback):
+    """Parse an LLM response as JSON, stripping code fences; return fallback on failure."""
+    m = _FENCE_RE.match(response)
+    body = m.group(1) if m else response.strip()
+    try:
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    except ValueError:
+        return fallback
 
 
 META_SYSTEM_PROMPT = (
@@ -13,21 +44,27 @@ META_SYSTEM_PROMPT = (
     "Respond ONLY with valid JSON. No markdown, no code fences."
 )
 
-META_USER_PROMPT = """Below are today's summaries from {n_podcasts} podcast episode(s) and \
-Bluesky Science Feed data ({n_bluesky} posts analyzed). Generate a JSON object:
+# The user prompt is split into a byte-stable prefix (schema + instructions)
+# and a per-day suffix. Provider prompt caches match on exact prefixes, so
+# keeping every variable — even the episode counts — after the static block
+# lets the schema portion be served from cache on each daily run.
+META_PROMPT_PREFIX = """Below are today's podcast episode summaries and \
+Bluesky Science Feed data. Generate a JSON object:
 
-{{
+{
   "executive_summary": "5-8 sentence meta-summary covering the most important findings across all sources. Reference multi-day patterns when the recent context shows recurring or evolving topics.",
   "shared_talking_points": ["topics that appeared across multiple sources"],
   "emerging_trends": ["new topics gaining traction — note if they also appeared in the past week"],
   "nasem_opportunities": ["where NASEM could engage, respond, or promote its work"],
   "misinformation_watch": ["notable claims contradicting scientific consensus, if any"]
-}}
+}
+"""
 
-TODAY'S PODCAST SUMMARIES:
+META_PROMPT_SUFFIX = """
+TODAY'S PODCAST SUMMARIES ({n_podcasts} episode(s)):
 {podcast_summaries}
 
-BLUESKY TRENDS:
+BLUESKY TRENDS ({n_bluesky} posts analyzed):
 {bluesky_summary}
 
 RECENT CONTEXT (past 7 days):
@@ -44,21 +81,24 @@ TREND_SYSTEM_PROMPT = (
     "Respond ONLY with valid JSON. No markdown, no code fences."
 )
 
-TREND_USER_PROMPT = """Analyze these cross-channel topics and recent episode summaries to identify \
+# Same static-prefix / dynamic-suffix split as the meta prompt.
+TREND_PROMPT_PREFIX = """Analyze these cross-channel topics and recent episode summaries to identify \
 3-5 trend narratives for NASEM leadership.
 
 For each trend, explain: what's converging across shows, what's emerging, or what's fading.
 
 Return a JSON array:
 [
-  {{
+  {
     "topic": "Short topic label",
     "narrative": "2-3 sentence analysis of the trend — what's happening, why now, how shows are covering it differently or similarly",
     "shows": ["Show Name 1", "Show Name 2"],
     "nasem_relevance": "One sentence on why this matters for NASEM"
-  }}
+  }
 ]
+"""
 
+TREND_PROMPT_SUFFIX = """
 CROSS-CHANNEL TOPICS (appeared on 2+ channels, last 14 days):
 {cross_channel_context}
 
@@ -67,11 +107,21 @@ RECENT EPISODE SUMMARIES (last 7 days):
 
 
 def _format_recent_context(recent_summaries):
-    """Condense recent summaries into ~1 line each for LLM context."""
+    """Condense recent summaries into ~1 line each for LLM context.
+
+    Output is sorted (newest first) so the same logical set always
+    renders to identical bytes regardless of caller ordering — provider
+    prompt caches and our own content-hash caches match on exact bytes.
+    """
     if not recent_summaries:
         return "No recent episode data available."
     lines = []
-    for s in recent_summaries:
+    ordered = sorted(
+        recent_summaries,
+        key=lambda s: (s.get('published', ''), s.get('podcast_name', '')),
+        reverse=True,
+    )
+    for s in ordered:
         name = s.get('podcast_name', '?')
         date = s.get('published', '')[:10]
         topics = ', '.join(s.get('science_topics', [])[:4])
@@ -80,24 +130,52 @@ def _format_recent_context(recent_summaries):
 
 
 def _format_cross_channel_context(cross_channel_topics):
-    """Format cross-channel topics for LLM context."""
+    """Format cross-channel topics for LLM context (deterministic order,
+    see _format_recent_context)."""
     if not cross_channel_topics:
         return "No cross-channel patterns detected yet."
     lines = []
-    for t in cross_channel_topics[:10]:
+    ordered = sorted(
+        cross_channel_topics,
+        key=lambda t: (-t.get('channel_count', 0), t.get('topic', '')),
+    )
+    for t in ordered[:10]:
         name = t.get('topic', '?')
         n_ch = t.get('channel_count', 0)
         channels = t.get('channels', {})
-        show_names = [ch.get('name', k) for k, ch in channels.items()]
-        lines.append(f"- {name} ({n_ch} channels: {', '.join(show_names)})")
+        shows = ', '.join(
+            ch.get('name', k) for k, ch in sorted(channels.items())
+        )
+        lines.append(f"- {name} ({n_ch} channels: {shows})")
     return '\n'.join(lines)
 
 
+def _synthesize_meta_locally(podcast_summaries):
+    """Meta-summary for a single-episode day, built without an LLM call."""
+    s = podcast_summaries[0]
+    summary = s.get("summary", "")
+    return {
+        "executive_summary": (
+            f"Only one episode today — {s.get('podcast_name', '?')}: "
+            f"{s.get('episode_title', '?')}. {summary}"
+        ).strip(),
+        "shared_talking_points": [],
+        "emerging_trends": s.get("science_topics", []),
+        "nasem_opportunities": [],
+        "misinformation_watch": s.get("claims_to_note", []),
+    }
+
+
 def generate_meta_summary(podcast_summaries, bluesky_digest,
-                          cross_channel_topics=None, recent_summaries=None):
+                          cross_channel_topics=None, recent_summaries=None,
+                          recent_context=None, cross_channel_context=None):
     """
     Generate a meta-summary across all sources with multi-day context.
 
+    build_digest passes preformatted recent_context/cross_channel_context
+    strings so the formatting work (shared with generate_trend_synthesis)
+    happens once; standalone callers can pass the raw lists instead.
+
     Returns dict with executive summary, talking points, trends, opportunities.
     """
     if not podcast_summaries and not bluesky_digest.get("trending_topics"):
@@ -109,46 +187,62 @@ def generate_meta_summary(podcast_summaries, bluesky_digest,
             "misinformation_watch": [],
         }
 
-    # Format podcast summaries for the prompt
-    podcast_text = ""
-    for s in podcast_summaries:
+    # With a single episode and no Bluesky trends there is nothing to
+    # synthesize across sources — assemble the "meta" summary directly
+    # from the episode fields instead of paying for an LLM round trip
+    if len(podcast_summaries) <= 1 and not bluesky_digest.get("trending_topics"):
+        return _synthesize_meta_locally(podcast_summaries)
+
+    from llm import ask_llm_stream
+
+    # Cap the episode count, keeping the highest-influence shows
+    prompt_summaries = podcast_summaries
+    if len(prompt_summaries) > MAX_EPISODES_IN_PROMPT:
+        from influence_scorer import sort_by_influence
+        prompt_summaries = sort_by_influence(prompt_summaries)[:MAX_EPISODES_IN_PROMPT]
+        print(f"  [WARN] Prompt capped at {MAX_EPISODES_IN_PROMPT} episodes "
+              f"({len(podcast_summaries) - MAX_EPISODES_IN_PROMPT} dropped)")
+
+    # Format podcast summaries for the prompt (list + join, like the
+    # _format_* helpers — repeated += on a str re-copies the whole buffer)
+    podcast_parts = []
+    for s in prompt_summaries:
         tier = s.get("influence_tier", "emerging").upper()
-        podcast_text += f"\n[{tier}] {s['podcast_name']} — {s['episode_title']}\n"
-        podcast_text += f"Summary: {s.get('summary', 'N/A')}\n"
+        podcast_parts.append(f"\n[{tier}] {s['podcast_name']} — {s['episode_title']}\n")
+        podcast_parts.append(f"Summary: {s.get('summary', 'N/A')[:MAX_SUMMARY_CHARS]}\n")
         topics = s.get("science_topics", [])
         if topics:
-            podcast_text += f"Topics: {', '.join(topics)}\n"
+            podcast_parts.append(f"Topics: {', '.join(topics)}\n")
         claims = s.get("claims_to_note", [])
         if claims:
-            podcast_text += f"Claims: {'; '.join(claims[:3])}\n"
+            podcast_parts.append(f"Claims: {'; '.join(claims[:3])}\n")
+    podcast_text = ''.join(podcast_parts)
 
     # Format Bluesky summary
-    bluesky_text = ""
-    for topic in bluesky_digest.get("trending_topics", []):
-        bluesky_text += f"- {topic.get('topic', '?')}: {topic.get('description', '')}\n"
+    bluesky_text = ''.join(
+        f"- {topic.get('topic', '?')}: {topic.get('description', '')}\n"
+        for topic in bluesky_digest.get("trending_topics", [])
+    )
     if not bluesky_text:
         bluesky_text = "No significant Bluesky trends detected."
 
-    prompt = META_USER_PROMPT.format(
+    prompt = META_PROMPT_PREFIX + META_PROMPT_SUFFIX.format(
         n_podcasts=len(podcast_summaries),
         n_bluesky=bluesky_digest.get("post_count", 0),
         podcast_summaries=podcast_text or "None processed today.",
         bluesky_summary=bluesky_text,
-        recent_context=_format_recent_context(recent_summaries),
-        cross_channel_context=_format_cross_channel_context(cross_channel_topics),
+        recent_context=(recent_context if recent_context is not None
+                        else _format_recent_context(recent_summaries)),
+        cross_channel_context=(cross_channel_context if cross_channel_context is not None
+                               else _format_cross_channel_context(cross_channel_topics)),
     )
 
     print("  Generating meta-summary...")
-    response = ask_llm(prompt, system_prompt=META_SYSTEM_PROMPT)
+    # Stream the response so accumulation happens during the network wait
+    response = ''.join(ask_llm_stream(prompt, system_prompt=META_SYSTEM_PROMPT))
 
-    try:
-        cleaned = response.strip()
-        if cleaned.startswith("```"):
-            cleaned = cleaned.split("\n", 1)[1]
-        if cleaned.endswith("```"):
-            cleaned = cleaned.rsplit("```", 1)[0]
-        meta = json.loads(cleaned.strip())
-    except json.JSONDecodeError:
+    meta = _parse_llm_json(response, None)
+    if meta is None:
         print("  [WARN] Failed to parse meta-summary JSON")
         meta = {
             "executive_summary": response[:500],
@@ -161,35 +255,93 @@ def generate_meta_summary(podcast_summaries, bluesky_digest,
     return meta
 
 
-def generate_trend_synthesis(cross_channel_topics, recent_summaries):
+def _trend_cache_key(cross_channel_topics, recent_summaries):
+    """Content hash of trend synthesis inputs, order-insensitive."""
+    material = json.dumps({
+        "cc": sorted(
+            [t.get("topic", ""), t.get("channel_count", 0)]
+            for t in cross_channel_topics
+        ),
+        "recent": sorted(
+            s.get("guid") or s.get("episode_title", "")
+            for s in recent_summaries
+        ),
+    }, sort_keys=True)
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _load_trend_cache():
+    try:
+        with open(TREND_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def _store_trend_cache(key, trends):
+    cache = _load_trend_cache()
+    now = time.time()
+    cutoff = now - TREND_CACHE_TTL_HOURS * 3600
+    cache = {k: e for k, e in cache.items() if e.get('timestamp', 0) >= cutoff}
+    cache[key] = {'trends': trends, 'timestamp': now}
+    try:
+        os.makedirs(os.path.dirname(TREND_CACHE_FILE), exist_ok=True)
+        with open(TREND_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except IOError as e:
+        print(f"  [WARN] Could not write trend cache: {e}")
+
+
+def generate_trend_synthesis(cross_channel_topics, recent_summaries,
+                             recent_context=None, cross_channel_context=None):
     """
     Generate 3-5 trend narratives from cross-channel data and recent history.
 
+    Accepts preformatted context strings from build_digest (see
+    generate_meta_summary).
+
+    The result is cached by a content hash of the inputs (topics + episode
+    identities, order-insensitive): the 14-day cross-channel window and
+    7-day episode window often don't change between consecutive runs, and
+    identical inputs skip the LLM call entirely.
+
     Returns list of trend dicts with topic, narrative, shows, nasem_relevance.
     """
     if not cross_channel_topics and not recent_summaries:
         return []
 
-    prompt = TREND_USER_PROMPT.format(
-        cross_channel_context=_format_cross_channel_context(cross_channel_topics),
-        recent_context=_format_recent_context(recent_summaries),
+    # Too little signal for a trend narrative — skip the call rather
+    # than ask the model to invent patterns from one data point
+    if len(cross_channel_topics) < 2 and len(recent_summaries) < 3:
+        return []
+
+    from llm import ask_llm_stream
+
+    cache_key = _trend_cache_key(cross_channel_topics, recent_summaries)
+    entry = _load_trend_cache().get(cache_key)
+    if entry and time.time() - entry.get('timestamp', 0) <= TREND_CACHE_TTL_HOURS * 3600:
+        print("  Trend synthesis unchanged since last run (cached)")
+        return entry.get('trends', [])
+
+    prompt = TREND_PROMPT_PREFIX + TREND_PROMPT_SUFFIX.format(
+        cross_channel_context=(cross_channel_context if cross_channel_context is not None
+                               else _format_cross_channel_context(cross_channel_topics)),
+        recent_context=(recent_context if recent_context is not None
+                        else _format_recent_context(recent_summaries)),
     )
 
     print("  Generating trend synthesis...")
-    response = ask_llm(prompt, system_prompt=TREND_SYSTEM_PROMPT)
+    response = ''.join(ask_llm_stream(prompt, system_prompt=TREND_SYSTEM_PROMPT))
 
-    try:
-        cleaned = response.strip()
-        if cleaned.startswith("```"):
-            cleaned = cleaned.split("\n", 1)[1]
-        if cleaned.endswith("```"):
-            cleaned = cleaned.rsplit("```", 1)[0]
-        trends = json.loads(cleaned.strip())
-        if not isinstance(trends, list):
-            trends = []
-    except json.JSONDecodeError:
+    trends = _parse_llm_json(response, None)
+    if trends is None:
         print("  [WARN] Failed to parse trend synthesis JSON")
         trends = []
+    elif not isinstance(trends, list):
+        trends = []
+
+    if trends:
+        _store_trend_cache(cache_key, trends)
 
     return trends
 
@@ -207,29 +359,69 @@ def build_digest(podcast_summaries, bluesky_digest, cross_channel_topics=None,
 
     Returns dict ready for HTML formatting.
     """
+    from influence_scorer import sort_by_influence
+
     # Sort podcasts by influence tier
     sorted_podcasts = sort_by_influence(podcast_summaries)
 
-    # Generate meta-summary with multi-day context
-    meta = generate_meta_summary(
-        podcast_summaries, bluesky_digest,
-        cross_channel_topics=cross_channel_topics,
-        recent_summaries=recent_summaries,
-    )
+    # Parse each publication date once here rather than per render — the
+    # digest can be rendered more than once (save + email), and the
+    # template then does a plain string substitution
+    for ep in sorted_podcasts:
+        try:
+            ep["published_display"] = datetime.fromisoformat(ep["published"]).strftime("%b %d")
+        except (KeyError, ValueError, TypeError):
+            ep["published_display"] = ""
+
+    # Meta-summary and trend synthesis are independent LLM calls, so run
+    # them in parallel — digest latency is then the slower of the two
+    # round trips instead of their sum. Trend synthesis only runs when we
+    # have cross-channel or recent data, as before.
+    # Both generators consume the same context blocks — format them once
+    # here so the work isn't repeated and both prompts share identical
+    # suffix bytes
+    recent_ctx = _format_recent_context(recent_summaries)
+    cc_ctx = _format_cross_channel_context(cross_channel_topics)
 
-    # Generate trend synthesis if we have cross-channel or recent data
     trend_synthesis = []
-    if cross_channel_topics or recent_summaries:
-        try:
-            trend_synthesis = generate_trend_synthesis(
-                cross_channel_topics or [], recent_summaries or []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        meta_future = pool.submit(
+            generate_meta_summary,
+            podcast_summaries, bluesky_digest,
+            recent_context=recent_ctx,
+            cross_channel_context=cc_ctx,
+        )
+        trend_future = None
+        if cross_channel_topics or recent_summaries:
+            trend_future = pool.submit(
+                generate_trend_synthesis,
+                cross_channel_topics or [], recent_summaries or [],
+                recent_context=recent_ctx,
+                cross_channel_context=cc_ctx,
             )
-        except Exception as e:
-            print(f"  [WARN] Trend synthesis failed: {e}")
+
+        meta = meta_future.result()
+        if trend_future is not None:
+            try:
+                trend_synthesis = trend_future.result()
+            except Exception as e:
+                print(f"  [WARN] Trend synthesis failed: {e}")
+
+    # One pass over the summaries for all stat counts — add new fields to
+    # the dict rather than growing one sum() pass per stat; `or ()` also
+    # covers explicit None values without allocating a default list
+    counts = {"science_topics": 0, "nasem_matches": 0, "claims_to_note": 0}
+    for s in podcast_summaries:
+        for k in counts:
+            counts[k] += len(s.get(k) or ())
+
+    # One timestamp for both fields — also keeps date and timestamp from
+    # disagreeing across a midnight boundary
+    now = datetime.now()
 
     digest = {
-        "date": datetime.now().strftime("%B %d, %Y"),
-        "timestamp": datetime.now().isoformat(),
+        "date": now.strftime("%B %d, %Y"),
+        "timestamp": now.isoformat(),
         "meta_summary": meta,
         "trend_synthesis": trend_synthesis,
         "podcast_episodes": sorted_podcasts,
@@ -238,15 +430,38 @@ def build_digest(podcast_summaries, bluesky_digest, cross_channel_topics=None,
         "stats": {
             "episodes_processed": len(podcast_summaries),
             "bluesky_posts_analyzed": bluesky_digest.get("post_count", 0),
-            "topics_extracted": sum(
-                len(s.get("science_topics", []))
-                for s in podcast_summaries
-            ),
-            "nasem_matches": sum(
-                len(s.get("nasem_matches", []))
-                for s in podcast_summaries
-            ),
+            "topics_extracted": counts["science_topics"],
+            "nasem_matches": counts["nasem_matches"],
+            "claims_flagged": counts["claims_to_note"],
         },
     }
 
     return digest
+
+
+def build_digests_batch(daily_inputs, max_workers=4):
+    """
+    Build digests for several days of inputs at once (historical backfill,
+    dev replays). Days are independent, so they run on a thread pool and
+    their LLM calls overlap instead of executing 2xN round trips serially.
+
+    Args:
+        daily_inputs: list of dicts with podcast_summaries, bluesky_digest,
+            and optionally cross_channel_topics / recent_summaries
+        max_workers: concurrent days — kept small to stay inside API
+            rate limits
+
+    Returns list of digest dicts in input order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                build_digest,
+                inp['podcast_summaries'],
+                inp['bluesky_digest'],
+                cross_channel_topics=inp.get('cross_channel_topics'),
+                recent_summaries=inp.get('recent_summaries'),
+            )
+            for inp in daily_inputs
+        ]
+        return [f.result() for f in futures]
@@ -2,21 +2,51 @@
 # Build topic_index.json and timeline_data.json from stored summaries
 # for client-side search on GitHub Pages
 
+import gzip
 import os
+import sys
 import json
+from collections import defaultdict
 from datetime import datetime
 from summary_store import load_recent_summaries
 
+try:
+    import orjson  # C-implemented encoder; stdlib json's indented path is pure Python
+except ImportError:
+    orjson = None
 
-def build_topic_index(days=90):
+
+def _write_json(filepath, data):
+    """Write pretty-printed UTF-8 JSON, via orjson when available, plus a
+    compact gzipped sibling (.json.gz) for clients that can use it."""
+    if orjson is not None:
+        pretty = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        compact = orjson.dumps(data)
+    else:
+        pretty = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        compact = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    with open(filepath, 'wb') as f:
+        f.write(pretty)
+    # mtime=0 keeps the archive byte-stable for identical data, so the
+    # Pages deploy only changes when the content does
+    with open(filepath + '.gz', 'wb') as f:
+        with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6, mtime=0) as gz:
+            gz.write(compact)
+
+
+def build_index_and_timeline(days=90):
     """
-    Build a search index from recent episode summaries.
+    Build the search index and timeline data in one pass over the
+    summaries, instead of walking every episode (and its topics) twice.
 
-    Returns list of episode entries with searchable fields.
+    Returns (index, timeline) — the list of searchable episode entries
+    and the cross-channel topic list for the timeline page.
     """
     summaries = load_recent_summaries(days=days)
 
     index = []
+    topic_map = {}
     for s in summaries:
         # Flatten NASEM matches for search
         nasem_pubs = []
@@ -42,7 +72,18 @@ def build_topic_index(days=90):
             'nasem_publications': nasem_pubs,
         }
         index.append(entry)
+        _accumulate_topics(topic_map, entry)
+
+    return index, _cross_channel_topics(topic_map)
+
 
+def build_topic_index(days=90):
+    """
+    Build a search index from recent episode summaries.
+
+    Returns list of episode entries with searchable fields.
+    """
+    index, _ = build_index_and_timeline(days=days)
     return index
 
 
@@ -57,59 +98,53 @@ def save_topic_index(index):
         'episodes': index,
     }
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(filepath, data)
 
     print(f"Built topic index with {len(index)} episodes")
     return filepath
 
 
-def build_timeline_data(index):
-    """
-    Build timeline_data.json for the timeline visualization page.
-
-    Extracts all topics with their first appearance dates and channels.
-    """
-    topic_map = {}  # normalized_topic -> {first_seen, channels: {channel: [dates]}}
-
-    for ep in index:
-        published = ep.get('published', '')
-        podcast_name = ep.get('podcast_name', '')
-
-        for topic in ep.get('science_topics', []):
-            norm = topic.lower().strip()
-            if norm not in topic_map:
-                topic_map[norm] = {
-                    'topic': topic,  # keep original casing from first occurrence
-                    'first_seen': published,
-                    'channels': {},
-                    'mention_count': 0,
-                }
-
-            entry = topic_map[norm]
-            entry['mention_count'] += 1
-
-            if podcast_name not in entry['channels']:
-                entry['channels'][podcast_name] = []
-            entry['channels'][podcast_name].append({
-                'date': published,
-                'episode': ep.get('episode_title', ''),
-            })
-
-            # Update first_seen if this is earlier
-            if published and (not entry['first_seen'] or published < entry['first_seen']):
-                entry['first_seen'] = published
-
-    # Filter to multi-channel topics (appeared on 2+ different podcasts)
+def _accumulate_topics(topic_map, ep):
+    """Fold one episode's science_topics into the timeline topic_map."""
+    published = ep.get('published', '')
+    podcast_name = ep.get('podcast_name', '')
+    episode_title = ep.get('episode_title', '')
+
+    for topic in ep.get('science_topics', []):
+        # Interning makes the repeated hash/equality work on recurring
+        # topics pointer comparisons instead of string scans
+        norm = sys.intern(topic.lower().strip())
+        entry = topic_map.setdefault(norm, {
+            'topic': topic,  # keep original casing from first occurrence
+            'channels': defaultdict(list),
+            'mention_count': 0,
+        })
+        entry['mention_count'] += 1
+        entry['channels'][podcast_name].append({
+            'date': published,
+            'episode': episode_title,
+        })
+
+
+def _cross_channel_topics(topic_map):
+    """Reduce a topic_map to the sorted multi-channel topic list."""
+    # Filter to multi-channel topics (appeared on 2+ different podcasts);
+    # first_seen is computed here, once per surviving topic, instead of
+    # being compared on every mention in the accumulation loop
     cross_channel = []
-    for norm, data in topic_map.items():
+    for data in topic_map.values():
         if len(data['channels']) >= 2:
+            first_seen = min(
+                (m['date'] for mentions in data['channels'].values()
+                 for m in mentions if m['date']),
+                default='',
+            )
             cross_channel.append({
                 'topic': data['topic'],
-                'first_seen': data['first_seen'],
+                'first_seen': first_seen,
                 'mention_count': data['mention_count'],
                 'channel_count': len(data['channels']),
-                'channels': data['channels'],
+                'channels': dict(data['channels']),
             })
 
     # Sort by mention count descending
@@ -118,6 +153,18 @@ def build_timeline_data(index):
     return cross_channel
 
 
+def build_timeline_data(index):
+    """
+    Build timeline_data.json for the timeline visualization page.
+
+    Extracts all topics with their first appearance dates and channels.
+    """
+    topic_map = {}  # normalized_topic -> {topic, channels: {channel: [mentions]}, mention_count}
+    for ep in index:
+        _accumulate_topics(topic_map, ep)
+    return _cross_channel_topics(topic_map)
+
+
 def save_timeline_data(timeline):
     """Write timeline_data.json to repo root for GitHub Pages."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -129,20 +176,16 @@ def save_timeline_data(timeline):
         'topics': timeline,
     }
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json(filepath, data)
 
     print(f"Built timeline data with {len(timeline)} cross-channel topics")
     return filepath
 
 
 if __name__ == '__main__':
-    print("Building topic index...")
-    index = build_topic_index(days=90)
+    print("Building topic index and timeline data...")
+    index, timeline = build_index_and_timeline(days=90)
     save_topic_index(index)
-
-    print("\nBuilding timeline data...")
-    timeline = build_timeline_data(index)
     save_timeline_data(timeline)
 
     print("\nDone!")
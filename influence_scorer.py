@@ -1,6 +1,9 @@
 # influence_scorer.py
 # Weight and sort content by influence tier
 
+from bisect import bisect_right
+from functools import partial
+
 TIER_ORDER = {"high": 0, "medium": 1, "emerging": 2}
 TIER_EMOJI = {"high": "\U0001f534", "medium": "\U0001f7e1", "emerging": "\U0001f7e2"}
 TIER_LABEL = {"high": "HIGH", "medium": "MEDIUM", "emerging": "EMERGING"}
@@ -16,15 +19,25 @@ def get_podcast_tier(episode):
     return episode.get("influence_tier", "emerging").lower()
 
 
+# Threshold table for bisect: index i holds the tier for counts in
+# [_BSKY_THRESHOLDS[i-1], _BSKY_THRESHOLDS[i])
+_BSKY_THRESHOLDS = [BLUESKY_EMERGING, BLUESKY_MEDIUM, BLUESKY_HIGH]
+_BSKY_TIERS = ["emerging", "emerging", "medium", "high"]
+
+
 def get_bluesky_tier(followers_count):
     """Calculate influence tier from Bluesky follower count."""
-    if followers_count >= BLUESKY_HIGH:
-        return "high"
-    elif followers_count >= BLUESKY_MEDIUM:
-        return "medium"
-    elif followers_count >= BLUESKY_EMERGING:
-        return "emerging"
-    return "emerging"
+    return _BSKY_TIERS[bisect_right(_BSKY_THRESHOLDS, followers_count)]
+
+
+def _influence_sort_key(item, tier_key="influence_tier", date_key="published"):
+    """Sort key: (tier rank, date string). ISO dates sort correctly."""
+    tier = item.get(tier_key, "emerging")
+    rank = TIER_ORDER.get(tier)
+    if rank is None:
+        # Only pay for the lowercase when the tier isn't already normalized
+        rank = TIER_ORDER.get(tier.lower(), 2)
+    return (rank, item.get(date_key) or "")
 
 
 def sort_by_influence(items, tier_key="influence_tier", date_key="published"):
@@ -33,25 +46,28 @@ def sort_by_influence(items, tier_key="influence_tier", date_key="published"):
 
     Returns sorted list.
     """
-    def sort_key(item):
-        tier = item.get(tier_key, "emerging").lower()
-        tier_rank = TIER_ORDER.get(tier, 2)
-        # Use date string for secondary sort (ISO format sorts correctly)
-        date = item.get(date_key, "")
-        return (tier_rank, "" if not date else date)
+    if tier_key == "influence_tier" and date_key == "published":
+        return sorted(items, key=_influence_sort_key)
+    return sorted(items, key=partial(_influence_sort_key, tier_key=tier_key, date_key=date_key))
 
-    return sorted(items, key=sort_key)
 
+def _render_tier_badge(bg, emoji, label):
+    return f'<span style="background:{bg};color:white;padding:2px 8px;border-radius:4px;font-size:11px;font-weight:bold;">{emoji} {label}</span>'
 
-def tier_badge_html(tier):
-    """Generate HTML badge for a tier."""
-    tier = tier.lower()
-    colors = {
+
+# Badge HTML depends only on the tier, so render all variants once at
+# import and make the per-call cost a dict lookup
+_TIER_BADGE_HTML = {
+    tier: _render_tier_badge(bg, TIER_EMOJI[tier], TIER_LABEL[tier])
+    for tier, (bg, _) in {
         "high": ("#c53030", "#fff5f5"),
         "medium": ("#d69e2e", "#fffff0"),
         "emerging": ("#38a169", "#f0fff4"),
-    }
-    bg, _ = colors.get(tier, ("#718096", "#f7fafc"))
-    label = TIER_LABEL.get(tier, "UNKNOWN")
-    emoji = TIER_EMOJI.get(tier, "")
-    return f'<span style="background:{bg};color:white;padding:2px 8px;border-radius:4px;font-size:11px;font-weight:bold;">{emoji} {label}</span>'
+    }.items()
+}
+_UNKNOWN_BADGE_HTML = _render_tier_badge("#718096", "", "UNKNOWN")
+
+
+def tier_badge_html(tier):
+    """Generate HTML badge for a tier."""
+    return _TIER_BADGE_HTML.get(tier.lower(), _UNKNOWN_BADGE_HTML)
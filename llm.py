@@ -1,6 +1,13 @@
 # llm.py
 # Wrapper for LLM API calls - supports Anthropic, OpenAI, and Grok
 
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from config import (
     LLM_PROVIDER,
     ANTHROPIC_API_KEY,
@@ -8,55 +15,223 @@ from config import (
     GROK_API_KEY,
     LLM_MODELS,
     LLM_MAX_TOKENS,
+    LLM_CACHE_FILE,
+    LLM_CACHE_TTL_HOURS,
 )
 
+# In-process view of the on-disk response cache, loaded on first use.
+# Entries map SHA256(system + prompt + model) -> {"response", "timestamp"}.
+_LLM_CACHE = {'loaded': False, 'entries': {}}
+
+# Serializes cache-file writes when ask_llm runs on several threads
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_key(prompt, system_prompt):
+    material = '\x00'.join([system_prompt or '', prompt, LLM_MODELS.get(LLM_PROVIDER, '')])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _cache_get(key):
+    """Return a cached response if present and within the TTL window."""
+    if not _LLM_CACHE['loaded']:
+        _LLM_CACHE['loaded'] = True
+        try:
+            with open(LLM_CACHE_FILE, 'r') as f:
+                _LLM_CACHE['entries'] = json.load(f)
+        except (IOError, ValueError):
+            _LLM_CACHE['entries'] = {}
+
+    entry = _LLM_CACHE['entries'].get(key)
+    if entry is None:
+        return None
+    if time.time() - entry.get('timestamp', 0) > LLM_CACHE_TTL_HOURS * 3600:
+        return None
+    return entry.get('response')
+
+
+def _cache_put(key, response):
+    """Store a response and persist the cache, dropping expired entries."""
+    now = time.time()
+    with _CACHE_LOCK:
+        entries = _LLM_CACHE['entries']
+        entries[key] = {'response': response, 'timestamp': now}
+        cutoff = now - LLM_CACHE_TTL_HOURS * 3600
+        stale = [k for k, e in entries.items() if e.get('timestamp', 0) < cutoff]
+        for k in stale:
+            del entries[k]
+        try:
+            os.makedirs(os.path.dirname(LLM_CACHE_FILE), exist_ok=True)
+            with open(LLM_CACHE_FILE, 'w') as f:
+                json.dump(entries, f)
+        except IOError as e:
+            print(f"  [WARN] Could not write LLM cache: {e}")
 
-def ask_llm(prompt, system_prompt=None):
+
+def ask_llm(prompt, system_prompt=None, use_cache=True):
     """
     Send a prompt to the configured LLM and get a response.
-    
+
     Args:
         prompt: The user message/question
         system_prompt: Optional system instructions
-    
+        use_cache: Reuse an identical response from the last 24h if available
+
     Returns:
         The text response from the LLM
     """
-    if LLM_PROVIDER == "anthropic":
-        return _ask_anthropic(prompt, system_prompt)
-    elif LLM_PROVIDER == "openai":
-        return _ask_openai(prompt, system_prompt)
-    elif LLM_PROVIDER == "grok":
-        return _ask_grok(prompt, system_prompt)
-    else:
-        raise ValueError(f"Unknown LLM provider: {LLM_PROVIDER}")
+    key = _cache_key(prompt, system_prompt) if use_cache else None
+    if key is not None:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
 
+    response = _ASK(prompt, system_prompt)
 
-def _ask_anthropic(prompt, system_prompt=None):
-    """Anthropic Claude API"""
-    import anthropic
-    
-    client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-    
+    if key is not None:
+        _cache_put(key, response)
+    return response
+
+
+def ask_llm_batch(prompts, max_workers=8, use_cache=True):
+    """
+    Resolve several prompts concurrently through the shared client pool.
+
+    Each call is network-bound, so issuing them together turns N
+    sequential round trips into roughly the latency of the slowest one.
+
+    Args:
+        prompts: list of prompt strings, or (prompt, system_prompt) tuples
+        max_workers: concurrent request cap
+        use_cache: same response reuse as ask_llm
+
+    Returns:
+        list of text responses in input order
+    """
+    normalized = [(p, None) if isinstance(p, str) else tuple(p) for p in prompts]
+    if not normalized:
+        return []
+    if len(normalized) == 1:
+        prompt, system_prompt = normalized[0]
+        return [ask_llm(prompt, system_prompt=system_prompt, use_cache=use_cache)]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(normalized))) as executor:
+        futures = [
+            executor.submit(ask_llm, prompt, system_prompt=system_prompt, use_cache=use_cache)
+            for prompt, system_prompt in normalized
+        ]
+        return [future.result() for future in futures]
+
+
+def ask_llm_stream(prompt, system_prompt=None, use_cache=True):
+    """
+    Like ask_llm, but yield the response as text chunks while it is still
+    being generated, so callers can accumulate or inspect output during
+    the network wait instead of blocking for the full body.
+
+    Shares the on-disk response cache with ask_llm — a cache hit yields
+    the stored text as a single chunk, and a completed stream is stored
+    for later ask_llm calls with the same prompt.
+    """
+    key = _cache_key(prompt, system_prompt) if use_cache else None
+    if key is not None:
+        cached = _cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    parts = []
+    for chunk in _STREAM(prompt, system_prompt):
+        parts.append(chunk)
+        yield chunk
+
+    if key is not None:
+        _cache_put(key, ''.join(parts))
+
+
+# One SDK client per provider for the life of the process — each client
+# owns an HTTP connection pool, so reusing it keeps the TLS handshake to
+# one per process instead of one per call
+_CLIENTS = {}
+
+
+def _get_client(provider):
+    client = _CLIENTS.get(provider)
+    if client is None:
+        if provider == "anthropic":
+            import anthropic
+            client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        elif provider == "openai":
+            from openai import OpenAI
+            client = OpenAI(api_key=OPENAI_API_KEY)
+        elif provider == "grok":
+            from openai import OpenAI
+            client = OpenAI(api_key=GROK_API_KEY, base_url="https://api.x.ai/v1")
+        else:
+            raise ValueError(f"Unknown LLM provider: {provider}")
+        _CLIENTS[provider] = client
+    return client
+
+
+def _anthropic_kwargs(prompt, system_prompt):
+    """Build the shared request kwargs for the Anthropic API."""
     kwargs = {
         "model": LLM_MODELS["anthropic"],
         "max_tokens": LLM_MAX_TOKENS,
         "messages": [{"role": "user", "content": prompt}],
     }
-    
     if system_prompt:
-        kwargs["system"] = system_prompt
-    
-    response = client.messages.create(**kwargs)
+        # Our system prompts are static strings, so mark them as a cached
+        # prefix — subsequent calls within the cache TTL bill the block at
+        # the cached-token rate and skip re-processing it.
+        kwargs["system"] = [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
+    return kwargs
+
+
+def _ask_anthropic(prompt, system_prompt=None):
+    """Anthropic Claude API"""
+    client = _get_client("anthropic")
+    response = client.messages.create(**_anthropic_kwargs(prompt, system_prompt))
     return response.content[0].text
 
 
+def _stream_anthropic(prompt, system_prompt=None):
+    """Anthropic Claude API, yielding text chunks as they arrive."""
+    client = _get_client("anthropic")
+    with client.messages.stream(**_anthropic_kwargs(prompt, system_prompt)) as stream:
+        for text in stream.text_stream:
+            yield text
+
+
+def _stream_openai_compatible(prompt, system_prompt=None):
+    """OpenAI / Grok chat API, yielding text chunks as they arrive."""
+    client = _get_client(LLM_PROVIDER)
+
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+
+    response = client.chat.completions.create(
+        model=LLM_MODELS[LLM_PROVIDER],
+        max_tokens=LLM_MAX_TOKENS,
+        messages=messages,
+        stream=True,
+    )
+    for chunk in response:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+
 def _ask_openai(prompt, system_prompt=None):
     """OpenAI GPT API"""
-    from openai import OpenAI
-    
-    client = OpenAI(api_key=OPENAI_API_KEY)
-    
+    client = _get_client("openai")
+
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
@@ -72,14 +247,8 @@ def _ask_openai(prompt, system_prompt=None):
 
 def _ask_grok(prompt, system_prompt=None):
     """xAI Grok API (OpenAI-compatible)"""
-    from openai import OpenAI
-    
-    # Grok uses OpenAI-compatible API with different base URL
-    client = OpenAI(
-        api_key=GROK_API_KEY,
-        base_url="https://api.x.ai/v1",
-    )
-    
+    client = _get_client("grok")
+
     messages = []
     if system_prompt:
         messages.append({"role": "system", "content": system_prompt})
@@ -93,6 +262,20 @@ def _ask_grok(prompt, system_prompt=None):
     return response.choices[0].message.content
 
 
+# Provider dispatch resolved once at import — LLM_PROVIDER never changes
+# within a process, and a bad value now fails at startup instead of on
+# the first call
+_PROVIDER_FUNCS = {
+    "anthropic": (_ask_anthropic, _stream_anthropic),
+    "openai": (_ask_openai, _stream_openai_compatible),
+    "grok": (_ask_grok, _stream_openai_compatible),
+}
+try:
+    _ASK, _STREAM = _PROVIDER_FUNCS[LLM_PROVIDER]
+except KeyError:
+    raise ValueError(f"Unknown LLM provider: {LLM_PROVIDER}") from None
+
+
 # Test if run directly
 if __name__ == "__main__":
     print(f"Testing {LLM_PROVIDER}...")
@@ -1,39 +1,76 @@
 # main.py
 # Science Podcast Monitor - Main Orchestrator
 
+import argparse
 import sys
 import os
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-from rss_monitor import check_all_feeds, mark_processed
-from audio_downloader import prepare_audio, cleanup_audio
-from transcriber import transcribe_episode
-from summarizer import summarize_episode
-from bluesky_monitor import get_bluesky_digest
-from digest_generator import build_digest
-from html_formatter import format_digest_html, save_digest
+from config import NASEM_CACHE_FILE, NASEM_CACHE_TTL_HOURS
 from summary_store import save_summary, load_recent_summaries
 from topic_tracker import record_podcast_topics, record_bluesky_topics, get_cross_channel_topics
 from alert_matcher import match_alerts, send_alerts
 
+# rss_monitor (feedparser), audio_downloader, transcriber, summarizer,
+# bluesky_monitor, digest_generator and html_formatter pull in the
+# third-party stack (feedparser, httpx, groq, anthropic, atproto,
+# jinja2), so they are imported inside the branches that use them —
+# --help, --setup and --test-email then run on stdlib imports alone,
+# the same way nasem_matcher and email_sender were already deferred.
 
-def process_episode(episode):
+
+# Replace unencodable characters once at the stream level (Windows
+# cp1252 consoles) instead of round-tripping every printed title
+# through encode/decode
+try:
+    sys.stdout.reconfigure(errors='replace')
+except (AttributeError, ValueError):
+    pass
+
+# Keeps the multi-line episode banner contiguous when several worker
+# threads are printing
+_PRINT_LOCK = threading.Lock()
+
+# In-flight digest snapshot. Deliberately NOT named digest_*.html: the
+# deploy steps in run_monitor.sh and daily-monitor.yml `git add
+# digest_*.html`, and they run even after a failed python invocation, so
+# a crashed run must never leave a partial snapshot matching that glob.
+INFLIGHT_DIGEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'inflight.html')
+
+
+def _remove_inflight_digest():
+    """Best-effort removal of the in-flight snapshot."""
+    try:
+        os.remove(INFLIGHT_DIGEST_FILE)
+    except OSError:
+        pass
+
+
+def download_episode(episode):
     """
-    Process a single episode through the full pipeline:
-    download -> transcribe -> summarize
+    Fetch an episode's raw input: the publisher transcript when the feed
+    offers one (Podcasting 2.0, skipping the audio path entirely),
+    otherwise the downloaded-and-prepared audio chunks.
 
-    Returns summary dict, or None on failure.
+    Returns a transcript dict, a list of audio paths, or None on failure.
     """
-    title = episode.get('title', 'Untitled')
+    from audio_downloader import prepare_audio
+    from transcriber import fetch_external_transcript
+
     podcast = episode.get('podcast_name', 'Unknown')
-    print(f"\n{'='*60}")
-    print(f"Processing: [{podcast}] {title}")
-    print(f"{'='*60}")
 
-    # Step 1: Download and prepare audio
-    print("\n[1/3] AUDIO DOWNLOAD")
+    if episode.get('transcript_url'):
+        transcript = fetch_external_transcript(episode)
+        if transcript:
+            return transcript
+
+    # Stage lines carry the podcast name so interleaved worker logs stay
+    # attributable
+    print(f"\n[1/3] AUDIO DOWNLOAD — {podcast}")
     audio_paths = prepare_audio(
         episode['audio_url'],
         episode_id=episode.get('podcast_id', 'ep')
@@ -41,21 +78,107 @@ def process_episode(episode):
     if not audio_paths:
         print(f"  [ERROR] Failed to download audio, skipping episode")
         return None
+    return audio_paths
 
-    try:
-        # Step 2: Transcribe
-        print("\n[2/3] TRANSCRIPTION")
-        transcript = transcribe_episode(audio_paths, episode)
 
-        # Step 3: Summarize
-        print("\n[3/3] SUMMARIZATION")
-        summary = summarize_episode(transcript)
+def process_prepared(episode, prepared):
+    """
+    Transcribe (when given audio) and summarize a fetched episode.
 
-        return summary
+    `prepared` is download_episode's result: a transcript dict goes
+    straight to summarization, audio paths get transcribed first and
+    cleaned up afterwards.
+    """
+    from audio_downloader import cleanup_audio
+    from transcriber import transcribe_episode
+    from summarizer import summarize_episode
+
+    podcast = episode.get('podcast_name', 'Unknown')
+
+    if isinstance(prepared, dict):
+        print(f"\n[SUMMARIZATION] — {podcast}")
+        return summarize_episode(prepared)
+
+    try:
+        print(f"\n[2/3] TRANSCRIPTION — {podcast}")
+        transcript = transcribe_episode(prepared, episode)
+
+        print(f"\n[3/3] SUMMARIZATION — {podcast}")
+        return summarize_episode(transcript)
 
     finally:
         # Always clean up audio files
-        cleanup_audio(audio_paths)
+        cleanup_audio(prepared)
+
+
+def process_episode(episode):
+    """
+    Process a single episode through the full pipeline:
+    download -> transcribe -> summarize
+
+    Returns summary dict, or None on failure.
+    """
+    title = episode.get('title', 'Untitled')
+    podcast = episode.get('podcast_name', 'Unknown')
+    with _PRINT_LOCK:
+        print(f"\n{'='*60}")
+        print(f"Processing: [{podcast}] {title}")
+        print(f"{'='*60}")
+
+    prepared = download_episode(episode)
+    if prepared is None:
+        return None
+    return process_prepared(episode, prepared)
+
+
+# On-disk view of topic -> NASEM lookup results, loaded on first use.
+# Topics recur heavily across episodes and across daily runs, so hits
+# skip the catalog scan entirely.
+_NASEM_CACHE = {'loaded': False, 'entries': {}}
+
+
+def _nasem_cache_entries():
+    if not _NASEM_CACHE['loaded']:
+        _NASEM_CACHE['loaded'] = True
+        try:
+            with open(NASEM_CACHE_FILE, 'r') as f:
+                _NASEM_CACHE['entries'] = json.load(f)
+        except (IOError, ValueError):
+            _NASEM_CACHE['entries'] = {}
+    return _NASEM_CACHE['entries']
+
+
+def _save_nasem_cache(entries, cutoff):
+    """Persist the lookup cache, dropping expired entries."""
+    stale = [k for k, e in entries.items() if e.get('timestamp', 0) < cutoff]
+    for k in stale:
+        del entries[k]
+    try:
+        os.makedirs(os.path.dirname(NASEM_CACHE_FILE), exist_ok=True)
+        with open(NASEM_CACHE_FILE, 'w') as f:
+            json.dump(entries, f)
+    except IOError as e:
+        print(f"  [WARN] Could not write NASEM cache: {e}")
+
+
+def _process_episode_with_retry(episode, attempts=2, backoff_seconds=15):
+    """Run process_episode, retrying once on failure.
+
+    Download blips and API rate limits are already retried inside their
+    own layers, but anything that escapes those (provider overload,
+    mid-transfer resets) used to drop the episode for the day. One
+    delayed re-attempt rescues most of these; a genuinely broken
+    episode costs one extra pass before the usual [ERROR] path.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return process_episode(episode)
+        except Exception as e:
+            if attempt == attempts:
+                raise
+            print(f"  [RETRY] {episode.get('podcast_name', '?')}: {e} — "
+                  f"retrying in {backoff_seconds * attempt}s")
+            time.sleep(backoff_seconds * attempt)
 
 
 def match_summaries_to_nasem(summaries):
@@ -68,13 +191,28 @@ def match_summaries_to_nasem(summaries):
 
     print(f"\n[NASEM] Matching topics to publications...")
 
+    entries = _nasem_cache_entries()
+    now = time.time()
+    cutoff = now - NASEM_CACHE_TTL_HOURS * 3600
+    dirty = False
+
     for summary in summaries:
         topics = summary.get('science_topics', [])
         matches = []
 
         for topic in topics[:5]:  # Limit to top 5 topics per episode
-            pubs = find_publications_for_topic(topic, use_llm_fallback=False)
-            projects = find_current_projects_for_topic(topic)
+            key = topic.strip().lower()
+            entry = entries.get(key)
+            if entry is None or entry.get('timestamp', 0) < cutoff:
+                entry = {
+                    'pubs': find_publications_for_topic(topic, use_llm_fallback=False),
+                    'projects': find_current_projects_for_topic(topic),
+                    'timestamp': now,
+                }
+                entries[key] = entry
+                dirty = True
+            pubs = entry['pubs']
+            projects = entry['projects']
 
             if pubs or projects:
                 matches.append({
@@ -87,12 +225,15 @@ def match_summaries_to_nasem(summaries):
         if matches:
             print(f"  [{summary['podcast_name']}] {len(matches)} topic(s) matched")
 
+    if dirty:
+        _save_nasem_cache(entries, cutoff)
+
     return summaries
 
 
 def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
                  send_email=False, podcast_only=False, bluesky_only=False,
-                 wall_clock_minutes=38):
+                 wall_clock_minutes=38, max_minutes=None):
     """
     Run the full podcast monitoring pipeline.
 
@@ -105,7 +246,13 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
         bluesky_only: Skip podcast processing
         wall_clock_minutes: Stop processing new episodes after this many minutes
                            to leave time for digest generation and git push
+        max_minutes: Skip episodes longer than this (default: PODCAST_MAX_MINUTES
+                     env var, or 120 — transcription cost scales with duration)
     """
+    from rss_monitor import check_all_feeds, mark_processed
+
+    if max_minutes is None:
+        max_minutes = int(os.environ.get('PODCAST_MAX_MINUTES', '120'))
     print("=" * 60)
     print("  SCIENCE PODCAST MONITOR")
     print(f"  {datetime.now().strftime('%B %d, %Y %H:%M')}")
@@ -116,6 +263,16 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
     processed_guids = []
     bluesky_data = {"post_count": 0, "trending_topics": [], "notable_posts": []}
 
+    # The Bluesky fetch is network I/O independent of episode processing,
+    # so start it now and collect the result at digest time — on normal
+    # runs it finishes well inside the transcription phase
+    bluesky_future = None
+    if not podcast_only and not dry_run:
+        from bluesky_monitor import get_bluesky_digest
+        bluesky_executor = ThreadPoolExecutor(max_workers=1)
+        bluesky_future = bluesky_executor.submit(get_bluesky_digest, hours_back=48)
+        bluesky_executor.shutdown(wait=False)
+
     # ===== PODCAST PIPELINE =====
     if not bluesky_only:
         episodes = check_all_feeds(lookback_days=lookback_days)
@@ -128,13 +285,12 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
             return
 
         if episodes:
-            # Skip episodes over 120 min — too long for free-tier transcription budget
-            MAX_EPISODE_MINUTES = 120
-            long = [e for e in episodes if (e.get('duration_minutes') or 0) > MAX_EPISODE_MINUTES]
+            # Skip over-long episodes — too long for free-tier transcription budget
+            long = [e for e in episodes if (e.get('duration_minutes') or 0) > max_minutes]
             if long:
                 for e in long:
-                    print(f"  [SKIP] {e['podcast_name']}: {e['title']} ({e.get('duration_minutes', 0):.0f} min > {MAX_EPISODE_MINUTES} min limit)")
-                episodes = [e for e in episodes if (e.get('duration_minutes') or 0) <= MAX_EPISODE_MINUTES]
+                    print(f"  [SKIP] {e['podcast_name']}: {e['title']} ({e.get('duration_minutes', 0):.0f} min > {max_minutes} min limit)")
+                episodes = [e for e in episodes if (e.get('duration_minutes') or 0) <= max_minutes]
 
             # Sort shortest first to maximize episodes processed within rate limits
             episodes.sort(key=lambda e: e.get('duration_minutes') or 60)
@@ -143,37 +299,64 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
                 print(f"\nLimiting to {max_episodes} episode(s) (of {len(episodes)} found)")
                 episodes = episodes[:max_episodes]
 
-            for episode in episodes:
-                # Check wall-clock budget before starting a new episode
-                elapsed_min = (time.monotonic() - pipeline_start) / 60
-                if elapsed_min >= wall_clock_minutes:
-                    remaining = len(episodes) - len(summaries)
-                    print(f"\n[TIME] {elapsed_min:.0f} min elapsed (budget: {wall_clock_minutes} min)")
-                    print(f"  Stopping episode processing to leave time for digest + git push")
-                    print(f"  {remaining} episode(s) deferred to next run")
-                    break
-
-                try:
-                    summary = process_episode(episode)
-                    if summary:
-                        summaries.append(summary)
-                        processed_guids.append(episode['guid'])
-                except Exception as e:
-                    print(f"\n[ERROR] Failed to process episode: {e}")
-                    continue
-
-            # Match to NASEM publications
-            if summaries:
-                summaries = match_summaries_to_nasem(summaries)
-
-            # Persist structured summaries for topic search
-            if summaries:
-                print(f"\n[STORE] Saving structured summaries...")
-                for s in summaries:
+            # Each episode is dominated by network waits — the CDN
+            # download, the Groq transcription calls, and the Anthropic
+            # summarization — so a small thread pool overlaps episodes
+            # at no extra API cost. Groq 429s from concurrent
+            # transcription are already retried with the server's
+            # suggested wait in transcribe_file.
+            workers = min(len(episodes), int(os.environ.get('PODCAST_WORKERS', '4')))
+            budget_hit = False
+            from html_formatter import save_digest_streamed
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_process_episode_with_retry, ep): ep for ep in episodes}
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
                     try:
-                        save_summary(s)
+                        summary = future.result()
+                        if summary:
+                            # Checkpoint each episode as it completes —
+                            # match, persist, and mark processed now, so
+                            # a crash or timeout mid-batch costs at most
+                            # the in-flight episodes
+                            match_summaries_to_nasem([summary])
+                            try:
+                                save_summary(summary)
+                            except Exception as e:
+                                print(f"  [WARN] Failed to save summary: {e}")
+                            summaries.append(summary)
+                            mark_processed([futures[future]['guid']])
+                            processed_guids.append(futures[future]['guid'])
+
+                            # Refresh the episodes-only in-flight digest
+                            # so long runs show progress before the full
+                            # digest (with its LLM meta-summary) exists.
+                            # This is a pure template render — no API
+                            # calls — so it costs nothing per episode.
+                            try:
+                                save_digest_streamed(
+                                    {
+                                        'podcast_episodes': list(summaries),
+                                        'stats': {'episodes_processed': len(summaries)},
+                                    },
+                                    filename=os.path.basename(INFLIGHT_DIGEST_FILE),
+                                )
+                            except Exception as e:
+                                print(f"  [WARN] In-flight digest render failed: {e}")
                     except Exception as e:
-                        print(f"  [WARN] Failed to save summary: {e}")
+                        print(f"\n[ERROR] Failed to process episode: {e}")
+
+                    # Check wall-clock budget: queued episodes are
+                    # cancelled once it's spent, in-flight ones finish
+                    elapsed_min = (time.monotonic() - pipeline_start) / 60
+                    if not budget_hit and elapsed_min >= wall_clock_minutes:
+                        budget_hit = True
+                        deferred = sum(1 for f in futures if f.cancel())
+                        if deferred:
+                            print(f"\n[TIME] {elapsed_min:.0f} min elapsed (budget: {wall_clock_minutes} min)")
+                            print(f"  Stopping episode processing to leave time for digest + git push")
+                            print(f"  {deferred} episode(s) deferred to next run")
 
             # Record topics for cross-channel tracking
             if summaries:
@@ -182,17 +365,15 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
                 except Exception as e:
                     print(f"  [WARN] Topic tracking failed: {e}")
 
-            # Mark episodes as processed
             if processed_guids:
-                mark_processed(processed_guids)
                 print(f"\nMarked {len(processed_guids)} episode(s) as processed")
         else:
             print("\nNo new podcast episodes to process.")
 
     # ===== BLUESKY PIPELINE =====
-    if not podcast_only:
+    if bluesky_future is not None:
         try:
-            bluesky_data = get_bluesky_digest(hours_back=48)
+            bluesky_data = bluesky_future.result()
             # Record Bluesky topics for cross-channel tracking
             try:
                 record_bluesky_topics(bluesky_data)
@@ -203,6 +384,9 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
 
     # ===== DIGEST GENERATION =====
     if summaries or bluesky_data.get("post_count", 0) > 0:
+        from digest_generator import build_digest
+        from html_formatter import save_digest_streamed
+
         print(f"\n[DIGEST] Building digest...")
 
         # Get cross-channel topics for the digest
@@ -226,8 +410,10 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
             cross_channel_topics=cross_channel_topics,
             recent_summaries=recent_summaries,
         )
-        html = format_digest_html(digest)
-        filepath = save_digest(html)
+        filepath = save_digest_streamed(digest)
+
+        # The final digest supersedes the in-flight snapshot
+        _remove_inflight_digest()
 
         # Send email if requested
         if send_email:
@@ -276,32 +462,48 @@ def run_pipeline(lookback_days=None, max_episodes=None, dry_run=False,
     return summaries
 
 
-def print_usage():
-    print("""
-Science Podcast Monitor
-
-Usage:
-  python main.py                  Run full pipeline (podcasts + Bluesky + digest)
-  python main.py --email          Run pipeline and send digest via email
-  python main.py --dry-run        Check feeds only, don't download/transcribe
-  python main.py --max N          Process at most N episodes
-  python main.py --lookback N     Check last N days for new episodes (default: 3)
-  python main.py --rss-only       Just check RSS feeds and show new episodes
-  python main.py --podcast-only   Skip Bluesky monitoring
-  python main.py --bluesky-only   Skip podcast processing
-  python main.py --test-email     Send a test email to verify configuration
-  python main.py --setup          Show setup instructions
-""")
+def print_new_episodes(lookback_days=None):
+    """List new episodes across all feeds without processing anything."""
+    from rss_monitor import check_all_feeds
+
+    episodes = check_all_feeds(lookback_days=lookback_days or 7)
+    for ep in episodes:
+        dur = f" ({ep['duration_minutes']:.0f} min)" if ep.get('duration_minutes') else ""
+        print(f"  - [{ep['podcast_name']}] {ep['title']}{dur}")
+        print(f"    Published: {ep.get('published', 'Unknown')}")
+        print(f"    Audio: {ep['audio_url'][:80]}...")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Science Podcast Monitor — run the full pipeline (podcasts + Bluesky + digest)')
+    parser.add_argument('--lookback', type=int, dest='lookback_days', metavar='N',
+                        help='check last N days for new episodes (default: 3)')
+    parser.add_argument('--max', type=int, dest='max_episodes', metavar='N',
+                        help='process at most N episodes')
+    parser.add_argument('--max-minutes', type=int, metavar='N',
+                        help='skip episodes longer than N minutes (default: 120)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help="check feeds only, don't download/transcribe")
+    parser.add_argument('--email', action='store_true', dest='send_email',
+                        help='send digest via email after generating')
+    parser.add_argument('--podcast-only', action='store_true',
+                        help='skip Bluesky monitoring')
+    parser.add_argument('--bluesky-only', action='store_true',
+                        help='skip podcast processing')
+    parser.add_argument('--rss-only', action='store_true',
+                        help='just check RSS feeds and show new episodes')
+    parser.add_argument('--test-email', action='store_true',
+                        help='send a test email to verify configuration')
+    parser.add_argument('--setup', action='store_true',
+                        help='show setup instructions')
+    return parser.parse_args(argv)
 
 
 if __name__ == '__main__':
-    args = sys.argv[1:]
+    args = parse_args()
 
-    if '--help' in args or '-h' in args:
-        print_usage()
-        sys.exit(0)
-
-    if '--setup' in args:
+    if args.setup:
         print("""
 Setup Instructions:
   1. Install dependencies: pip install -r requirements.txt
@@ -316,7 +518,7 @@ Setup Instructions:
 """)
         sys.exit(0)
 
-    if '--test-email' in args:
+    if args.test_email:
         from email_sender import check_email_config, send_test_email
         print("Checking email configuration...")
         status = check_email_config()
@@ -332,36 +534,19 @@ Setup Instructions:
                 print(f"[!] {result['message']}")
         sys.exit(0)
 
-    lookback_days = None
-    max_episodes = None
-    dry_run = '--dry-run' in args
-    rss_only = '--rss-only' in args
-    send_email = '--email' in args
-    podcast_only = '--podcast-only' in args
-    bluesky_only = '--bluesky-only' in args
-
-    if '--lookback' in args:
-        idx = args.index('--lookback')
-        lookback_days = int(args[idx + 1])
-
-    if '--max' in args:
-        idx = args.index('--max')
-        max_episodes = int(args[idx + 1])
-
-    if rss_only:
-        episodes = check_all_feeds(lookback_days=lookback_days or 7)
-        for ep in episodes:
-            dur = f" ({ep['duration_minutes']:.0f} min)" if ep.get('duration_minutes') else ""
-            title = ep['title'].encode('ascii', 'replace').decode('ascii')
-            print(f"  - [{ep['podcast_name']}] {title}{dur}")
-            print(f"    Published: {ep.get('published', 'Unknown')}")
-            print(f"    Audio: {ep['audio_url'][:80]}...")
+    if args.rss_only:
+        print_new_episodes(lookback_days=args.lookback_days)
     else:
-        run_pipeline(
-            lookback_days=lookback_days,
-            max_episodes=max_episodes,
-            dry_run=dry_run,
-            send_email=send_email,
-            podcast_only=podcast_only,
-            bluesky_only=bluesky_only,
-        )
+        try:
+            run_pipeline(
+                lookback_days=args.lookback_days,
+                max_episodes=args.max_episodes,
+                dry_run=args.dry_run,
+                send_email=args.send_email,
+                podcast_only=args.podcast_only,
+                bluesky_only=args.bluesky_only,
+                max_minutes=args.max_minutes,
+            )
+        finally:
+            # Even on a crashed run, don't leave the snapshot behind
+            _remove_inflight_digest()
@@ -6,8 +6,21 @@
 import re
 import os
 import json
+import heapq
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from llm import ask_llm
 
+# Read once — recency scoring only needs the year, and a clock read per
+# publication per topic adds up across the catalog scan
+CURRENT_YEAR = datetime.now().year
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Topic expansion: maps broad topics to related specific terms for better matching
 # When searching for "space", also search for "mars", "moon", etc.
 TOPIC_EXPANSIONS = {
@@ -29,11 +42,13 @@ CURRENT_PROJECTS = []
 try:
     catalog_path = os.path.join(os.path.dirname(__file__), 'nasem_catalog.json')
     if os.path.exists(catalog_path):
-        with open(catalog_path, 'r', encoding='utf-8') as f:
-            catalog_data = json.load(f)
-            SCRAPED_CATALOG = catalog_data.get('publications', [])
-            CURRENT_PROJECTS = catalog_data.get('current_projects', [])
-            print(f"  Loaded {len(SCRAPED_CATALOG)} publications + {len(CURRENT_PROJECTS)} current projects")
+        # orjson parses the 2.4MB catalog noticeably faster when available
+        with open(catalog_path, 'rb') as f:
+            raw = f.read()
+        catalog_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        SCRAPED_CATALOG = catalog_data.get('publications', [])
+        CURRENT_PROJECTS = catalog_data.get('current_projects', [])
+        print(f"  Loaded {len(SCRAPED_CATALOG)} publications + {len(CURRENT_PROJECTS)} current projects")
 except Exception:
     pass
 
@@ -148,36 +163,147 @@ TITLE_STOP_WORDS = {
 }
 
 
-def extract_keywords_from_title(title):
-    """Extract meaningful keywords from a publication title."""
-    # Clean and split title
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
+# Two-word phrases (and a few single terms) worth keeping whole when
+# they appear in a title; module-level so the list isn't rebuilt on
+# every extraction call
+MEANINGFUL_PHRASES = [
+    'artificial intelligence', 'machine learning', 'climate change', 'gene therapy',
+    'cancer research', 'stem cells', 'public health', 'mental health', 'nuclear energy',
+    'quantum computing', 'infectious disease', 'drug discovery', 'precision medicine',
+    'renewable energy', 'carbon emissions', 'biodiversity loss', 'food security',
+    'water quality', 'air pollution', 'opioid crisis', 'vaccine safety', 'gene editing',
+    'ocean science', 'space exploration', 'arctic research', 'wildfire', 'pandemic',
+    'antibiotic resistance', 'global health', 'health equity', 'brain science',
+    'neuroscience', 'alzheimer', 'dementia', 'diabetes', 'obesity', 'aging population',
+]
+# Precompiled once — titles are scanned in bulk at catalog load
+_TITLE_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
 
-    # Filter out stop words and return unique keywords
-    keywords = []
-    for word in words:
-        if word not in TITLE_STOP_WORDS and len(word) >= 4:
-            keywords.append(word)
 
-    # Also extract 2-word phrases that might be meaningful
+def extract_keywords_from_title(title):
+    """Extract meaningful keywords from a publication title."""
     title_lower = title.lower()
-    meaningful_phrases = [
-        'artificial intelligence', 'machine learning', 'climate change', 'gene therapy',
-        'cancer research', 'stem cells', 'public health', 'mental health', 'nuclear energy',
-        'quantum computing', 'infectious disease', 'drug discovery', 'precision medicine',
-        'renewable energy', 'carbon emissions', 'biodiversity loss', 'food security',
-        'water quality', 'air pollution', 'opioid crisis', 'vaccine safety', 'gene editing',
-        'ocean science', 'space exploration', 'arctic research', 'wildfire', 'pandemic',
-        'antibiotic resistance', 'global health', 'health equity', 'brain science',
-        'neuroscience', 'alzheimer', 'dementia', 'diabetes', 'obesity', 'aging population',
+
+    # Filter out stop words
+    keywords = [
+        word for word in _TITLE_WORD_RE.findall(title_lower)
+        if len(word) >= 4 and word not in TITLE_STOP_WORDS
     ]
-    for phrase in meaningful_phrases:
+
+    # Also extract known meaningful phrases kept whole
+    for phrase in MEANINGFUL_PHRASES:
         if phrase in title_lower and phrase not in keywords:
             keywords.append(phrase)
 
     return keywords
 
 
+# Combined list so one index covers both sources; entries below
+# _VERIFIED_COUNT are hand-curated and keep their scoring bonus
+ALL_PUBLICATIONS = VERIFIED_PUBLICATIONS + SCRAPED_CATALOG
+_VERIFIED_COUNT = len(VERIFIED_PUBLICATIONS)
+
+
+def _with_singulars(tokens):
+    """Add trimmed-plural forms so 'genomics' and 'genomic' meet.
+
+    The substring checks inside score_publication match across plural
+    boundaries; the index lookup is exact-token, so fold simple plurals
+    on both the index and query side to keep that recall.
+    """
+    folded = set(tokens)
+    for token in tokens:
+        if len(token) >= 5 and token.endswith('s'):
+            folded.add(token[:-1])
+            if token.endswith('es'):
+                folded.add(token[:-2])
+    return folded
+
+
+def _preprocess_publications():
+    """Stamp each publication with lowercased title/description/keywords.
+
+    score_publication used to lowercase these fields on every call —
+    topics x 1,300 pubs worth of redundant str.lower() allocations per
+    batch. Done once here; the scoring loop just reads the cached
+    fields. The frozensets back the LLM fallback's candidate filter.
+    """
+    for pub in ALL_PUBLICATIONS:
+        pub['_title_lc'] = pub.get('title', '').lower()
+        pub['_desc_lc'] = pub.get('description', '').lower()
+        keywords = pub.get('keywords') or extract_keywords_from_title(pub.get('title', ''))
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        pub['_keywords_lc'] = tuple(k.lower() for k in keywords)
+        pub['_topics_set'] = frozenset(pub.get('topics', []))
+        pub['_title_tokens_set'] = frozenset(
+            _with_singulars(set(re.findall(r'\w{4,}', pub['_title_lc']))))
+
+
+_preprocess_publications()
+
+
+def _public_view(pub):
+    """Copy of a catalog entry without the _-prefixed working fields.
+
+    Matcher results land in summary records and on-disk caches that
+    JSON-serialize them, so the precomputed frozensets/tuples must never
+    leave this module.
+    """
+    return {k: v for k, v in pub.items() if not k.startswith('_')}
+
+
+# Newest ~400 catalog entries (higher IDs are newer) — the LLM
+# fallback's candidate pool, sorted once here instead of re-sorting the
+# whole catalog on every weak-match call
+RECENT_PUBS = sorted(SCRAPED_CATALOG, key=lambda x: int(x.get('id') or 0), reverse=True)[:400]
+
+
+def _build_catalog_index():
+    """Build an inverted index: token -> set of indices into ALL_PUBLICATIONS.
+
+    Each publication is indexed under its keyword tokens, title words
+    (4+ chars, matching the topic-word cutoff) and description words
+    (5+ chars, matching the description scoring cutoff). Topic lookups
+    then only score the publications that share at least one token with
+    the topic instead of scanning the whole catalog.
+    """
+    index = defaultdict(set)
+    for i, pub in enumerate(ALL_PUBLICATIONS):
+        tokens = set()
+        for keyword in pub['_keywords_lc']:
+            tokens.update(re.findall(r'\w+', keyword))
+        tokens.update(re.findall(r'\w{4,}', pub['_title_lc']))
+        tokens.update(re.findall(r'\w{5,}', pub['_desc_lc']))
+        for token in _with_singulars(tokens):
+            index[token].add(i)
+    return dict(index)
+
+
+CATALOG_INDEX = _build_catalog_index()
+
+
+def _candidate_publication_ids(topic_lower, topic_words):
+    """Look up the index entries a topic could possibly score against."""
+    # All topic tokens (any length, so short keywords like "ai" still
+    # hit) plus the expanded words; expansion phrases may be multi-word
+    tokens = set(re.findall(r'\w+', topic_lower))
+    for word in topic_words:
+        tokens.update(word.split())
+    candidates = set()
+    for token in _with_singulars(tokens):
+        candidates.update(CATALOG_INDEX.get(token, ()))
+    return candidates
+
+
+# Memo for LLM relevance calls, keyed on the normalized topic plus the
+# exact candidate set — case/word-order variants of a topic asked
+# against the same candidates reuse the answer without another LLM
+# round-trip. (ask_llm's own disk cache only catches byte-identical
+# prompts.)
+_SEMANTIC_MATCH_CACHE = {}
+
+
 def llm_semantic_match(topic_name, candidate_titles, max_titles=10):
     """Use LLM to find semantically related publications from candidates."""
     if not candidate_titles:
@@ -185,6 +311,12 @@ def llm_semantic_match(topic_name, candidate_titles, max_titles=10):
 
     # Limit the number of candidates to check
     titles_to_check = candidate_titles[:max_titles]
+
+    cache_key = (_normalize_topic(topic_name), tuple(titles_to_check))
+    cached = _SEMANTIC_MATCH_CACHE.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
     titles_str = "\n".join([f"{i+1}. {t}" for i, t in enumerate(titles_to_check)])
 
     prompt = f"""Given this trending news topic: "{topic_name}"
@@ -202,45 +334,75 @@ No explanation needed."""
         response = response.strip().lower()
 
         if 'none' in response or not response:
+            _SEMANTIC_MATCH_CACHE[cache_key] = []
             return []
 
         # Parse the numbers
         numbers = re.findall(r'\d+', response)
         indices = [int(n) - 1 for n in numbers if 0 <= int(n) - 1 < len(titles_to_check)]
 
-        return indices
+        _SEMANTIC_MATCH_CACHE[cache_key] = indices
+        return list(indices)
     except Exception:
         return []
 
 
-def score_publication(pub, topic_lower, topic_words):
+def compile_topic_patterns(topic_words):
+    """Compile the topic's word set into two alternation patterns.
+
+    One fused pattern per field means the regex engine walks each title
+    or description a single time instead of once per topic word. Built
+    once per topic lookup and reused across the whole catalog scan.
+    Returns (title_pattern, description_pattern); the description
+    pattern only includes words of 5+ chars (shorter words are too
+    noisy there) and either may be None when no words qualify.
+    """
+    def _alternation(words):
+        if not words:
+            return None
+        return re.compile(r'\b(?:' + '|'.join(re.escape(w) for w in words) + r')\b')
+
+    return (_alternation(topic_words),
+            _alternation([w for w in topic_words if len(w) >= 5]))
+
+
+def score_publication(pub, topic_lower, topic_words, topic_patterns=None, require_keyword=False,
+                      long_topic_words=None):
     """
     Score a publication against a topic using enriched metadata.
 
+    When require_keyword is set the caller will discard any result
+    without a keyword hit (the rule for hand-curated entries), so the
+    scorer returns early without scanning the title and description.
+
     Returns (total_score, breakdown) where breakdown has component scores.
     """
+    if topic_patterns is None:
+        topic_patterns = compile_topic_patterns(topic_words)
+    title_pattern, description_pattern = topic_patterns
+    if long_topic_words is None:
+        long_topic_words = tuple(w for w in topic_words if len(w) >= 5)
     keyword_score = 0
     title_score = 0
     description_score = 0
     recency_score = 0
 
-    # Get keywords - handle both scraped format and hand-curated format
-    keywords = pub.get("keywords", [])
-    if isinstance(keywords, str):
-        keywords = [keywords]
-
-    # If no keywords, extract from title
-    if not keywords:
-        keywords = extract_keywords_from_title(pub.get("title", ""))
+    # Lowercased keywords, precomputed at load (covers both scraped and
+    # hand-curated formats, with title extraction as the fallback)
+    keywords = pub.get("_keywords_lc")
+    if keywords is None:
+        keywords = pub.get("keywords") or extract_keywords_from_title(pub.get("title", ""))
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        keywords = [k.lower() for k in keywords]
 
     # Check if any keyword appears in the topic (primary match)
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
+    for keyword_lower in keywords:
         if keyword_lower in topic_lower:
             # Longer keyword matches are more valuable
-            if len(keyword) >= 12:
+            if len(keyword_lower) >= 12:
                 keyword_score += 6  # Very specific match (e.g., "climate change")
-            elif len(keyword) >= 8:
+            elif len(keyword_lower) >= 8:
                 keyword_score += 4  # Strong match (e.g., "immunotherapy")
             else:
                 keyword_score += 2  # Regular match
@@ -248,29 +410,28 @@ def score_publication(pub, topic_lower, topic_words):
         elif keyword_lower in topic_words:
             keyword_score += 3  # Good match via expansion
         # Also check reverse: topic words in keyword (catches phrase matches)
-        elif any(word in keyword_lower for word in topic_words if len(word) >= 5):
+        elif any(word in keyword_lower for word in long_topic_words):
             keyword_score += 1
 
+    if require_keyword and keyword_score <= 0:
+        return 0, {'keyword': 0, 'title': 0, 'description': 0, 'recency': 0}
+
     # Check if any word from the topic appears in the title (secondary)
-    title_lower = pub.get("title", "").lower()
-    for word in topic_words:
-        # Use word boundary matching to avoid partial matches
-        if re.search(r'\b' + re.escape(word) + r'\b', title_lower):
-            title_score += 1.5  # Title word match (slightly boosted)
+    title_lower = pub["_title_lc"] if "_title_lc" in pub else pub.get("title", "").lower()
+    if title_pattern is not None:
+        # set() so each distinct word scores once, matching the old
+        # per-word loop; word boundaries still avoid partial matches
+        title_score = 1.5 * len(set(title_pattern.findall(title_lower)))
 
     # Check description for matches (new enriched field)
-    description = pub.get("description", "").lower()
-    if description:
-        for word in topic_words:
-            if len(word) >= 5 and re.search(r'\b' + re.escape(word) + r'\b', description):
-                description_score += 0.5  # Description matches worth less than title
+    description = pub["_desc_lc"] if "_desc_lc" in pub else pub.get("description", "").lower()
+    if description and description_pattern is not None:
+        description_score = 0.5 * len(set(description_pattern.findall(description)))
 
     # Recency bonus (new enriched field)
     year = pub.get("year", 0)
     if year:
-        from datetime import datetime
-        current_year = datetime.now().year
-        age = current_year - year
+        age = CURRENT_YEAR - year
         if age <= 2:
             recency_score = 3  # Very recent (last 2 years)
         elif age <= 5:
@@ -297,37 +458,123 @@ def expand_topic_words(topic_words):
     return expanded
 
 
+# Trigger word -> broad catalog categories, for steering the LLM
+# fallback's candidate pool. One dict lookup per topic token replaces
+# the old chain of substring scans (which also mis-fired on
+# coincidences like 'sea' inside 'research')
+WORD_TO_CATEGORIES = {}
+for _words, _cats in [
+    (('ai', 'artificial', 'intelligence', 'machine', 'learning', 'robot'),
+     ('technology', 'computing', 'artificial-intelligence')),
+    (('climate', 'warming', 'carbon', 'emissions', 'environment'),
+     ('climate', 'environment', 'energy')),
+    (('cancer', 'tumor', 'oncology', 'immunotherapy'),
+     ('cancer', 'biomedical', 'health')),
+    (('gene', 'genetic', 'dna', 'crispr', 'genome'),
+     ('biomedical', 'genetics')),
+    (('vaccine', 'virus', 'infectious', 'pandemic', 'outbreak'),
+     ('covid', 'global-health', 'infectious-disease')),
+    (('brain', 'neuro', 'mental', 'dementia', 'alzheimer'),
+     ('mental-health', 'behavioral-health', 'neuroscience')),
+    (('space', 'nasa', 'planet', 'asteroid', 'mars', 'moon'),
+     ('astronomy', 'space', 'planetary')),
+    (('ocean', 'marine', 'sea', 'coastal', 'fish'),
+     ('ocean', 'environment', 'marine')),
+]:
+    for _w in _words:
+        WORD_TO_CATEGORIES[_w] = WORD_TO_CATEGORIES.get(_w, ()) + _cats
+
+# Triggers that should also match as word prefixes, so 'genetics',
+# 'neuroscience' and 'planetary' still map to their categories
+_PREFIX_CATEGORY_TRIGGERS = tuple(
+    (w, WORD_TO_CATEGORIES[w]) for w in ('gene', 'neuro', 'planet', 'vaccine', 'marine'))
+
+
+def _categories_for_topic(topic_lower):
+    """Map a topic's tokens to broad catalog categories."""
+    categories = set()
+    for token in set(re.findall(r'\w+', topic_lower)):
+        cats = WORD_TO_CATEGORIES.get(token)
+        if cats is None:
+            for trigger, trigger_cats in _PREFIX_CATEGORY_TRIGGERS:
+                if token.startswith(trigger):
+                    cats = trigger_cats
+                    break
+        if cats:
+            categories.update(cats)
+    return categories
+
+
+# In-process memo for topic lookups, keyed on the normalized topic so
+# case/word-order variants of the same topic ("AI in Research" vs
+# "Research in AI") share one catalog scan — and one LLM fallback call.
+# Results persist across runs via the nasem_cache in main.py; this memo
+# covers repeats within a single process.
+_TOPIC_RESULT_CACHE = {}
+
+
+def _normalize_topic(topic_name):
+    """Normalize a topic to a sorted token-set string for cache keys."""
+    tokens = sorted(set(re.findall(r'\w{4,}', topic_name.lower())))
+    return ' '.join(tokens) if tokens else topic_name.strip().lower()
+
+
 def find_publications_for_topic(topic_name, use_llm_fallback=True):
     """Find relevant publications from both hand-curated and scraped sources."""
+    cache_key = (_normalize_topic(topic_name), use_llm_fallback)
+    cached = _TOPIC_RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return [dict(pub) for pub in cached]
+
+    result = _find_publications_uncached(topic_name, use_llm_fallback)
+
+    if len(_TOPIC_RESULT_CACHE) >= 1024:
+        _TOPIC_RESULT_CACHE.clear()
+    _TOPIC_RESULT_CACHE[cache_key] = result
+    # Per-call copies: callers store these in summaries/caches and may
+    # annotate them — shared references would corrupt the memo
+    return [dict(pub) for pub in result]
+
+
+def _find_publications_uncached(topic_name, use_llm_fallback):
+    """The actual catalog scan behind find_publications_for_topic."""
     topic_lower = topic_name.lower()
     topic_words = set(re.findall(r'\b\w{4,}\b', topic_lower))  # Words with 4+ chars
 
     # Expand topic words with related terms (e.g., "space" → includes "mars", "moon")
     topic_words = expand_topic_words(topic_words)
+    topic_patterns = compile_topic_patterns(topic_words)
+    # Hoisted out of the scorer: the len filter is invariant per topic
+    long_topic_words = tuple(w for w in topic_words if len(w) >= 5)
 
     matches = {}  # Use dict to deduplicate by ID
 
-    # First, search hand-curated list (has better keywords)
-    for pub in VERIFIED_PUBLICATIONS:
-        total_score, breakdown = score_publication(pub, topic_lower, topic_words)
-        if breakdown['keyword'] > 0:
-            pub_id = pub["id"]
+    # Only score publications sharing at least one token with the topic
+    # (typically a few dozen) instead of scanning the whole catalog
+    for i in sorted(_candidate_publication_ids(topic_lower, topic_words)):
+        pub = ALL_PUBLICATIONS[i]
+        curated = i < _VERIFIED_COUNT
+        total_score, breakdown = score_publication(
+            pub, topic_lower, topic_words, topic_patterns, require_keyword=curated,
+            long_topic_words=long_topic_words)
+        if curated:
+            # Hand-curated list (has better keywords)
+            if breakdown['keyword'] <= 0:
+                continue
             total_score += 5  # Bonus for curated entries
-            if pub_id not in matches or matches[pub_id][0] < total_score:
-                matches[pub_id] = (total_score, pub, breakdown)
-
-    # Then search scraped catalog (has broader coverage with enriched data)
-    for pub in SCRAPED_CATALOG:
-        total_score, breakdown = score_publication(pub, topic_lower, topic_words)
-        # Allow match if good keyword score, or strong title match, or description match
-        if breakdown['keyword'] > 0 or breakdown['title'] >= 3 or breakdown['description'] >= 1:
-            pub_id = pub["id"]
-            if pub_id not in matches or matches[pub_id][0] < total_score:
-                matches[pub_id] = (total_score, pub, breakdown)
-
-    # Sort by score (descending)
-    sorted_matches = sorted(matches.values(), key=lambda x: -x[0])
-    result = [m[1] for m in sorted_matches[:8]]  # Return up to 8 candidates
+        else:
+            # Scraped catalog (broader coverage with enriched data):
+            # allow match on good keyword score, strong title match, or
+            # description match
+            if not (breakdown['keyword'] > 0 or breakdown['title'] >= 3 or breakdown['description'] >= 1):
+                continue
+        pub_id = pub["id"]
+        if pub_id not in matches or matches[pub_id][0] < total_score:
+            matches[pub_id] = (total_score, pub, breakdown)
+
+    # Top 8 by score — nlargest skips sorting the losers
+    sorted_matches = heapq.nlargest(8, matches.values(), key=lambda x: x[0])
+    result = [_public_view(m[1]) for m in sorted_matches]  # Return up to 8 candidates
 
     # LLM fallback: only if we found very few/weak matches AND it's enabled
     # With enriched catalog data, we need LLM fallback less often
@@ -337,35 +584,18 @@ def find_publications_for_topic(topic_name, use_llm_fallback=True):
         # Gather candidate titles from catalog for LLM to evaluate
         # Filter to recent publications (higher IDs = more recent) and relevant topics
         candidate_pubs = []
-        topic_categories = []
 
         # Map topic words to broad categories
-        if any(w in topic_lower for w in ['ai', 'artificial', 'intelligence', 'machine', 'learning', 'robot']):
-            topic_categories.extend(['technology', 'computing', 'artificial-intelligence'])
-        if any(w in topic_lower for w in ['climate', 'warming', 'carbon', 'emissions', 'environment']):
-            topic_categories.extend(['climate', 'environment', 'energy'])
-        if any(w in topic_lower for w in ['cancer', 'tumor', 'oncology', 'immunotherapy']):
-            topic_categories.extend(['cancer', 'biomedical', 'health'])
-        if any(w in topic_lower for w in ['gene', 'genetic', 'dna', 'crispr', 'genome']):
-            topic_categories.extend(['biomedical', 'genetics'])
-        if any(w in topic_lower for w in ['vaccine', 'virus', 'infectious', 'pandemic', 'outbreak']):
-            topic_categories.extend(['covid', 'global-health', 'infectious-disease'])
-        if any(w in topic_lower for w in ['brain', 'neuro', 'mental', 'dementia', 'alzheimer']):
-            topic_categories.extend(['mental-health', 'behavioral-health', 'neuroscience'])
-        if any(w in topic_lower for w in ['space', 'nasa', 'planet', 'asteroid', 'mars', 'moon']):
-            topic_categories.extend(['astronomy', 'space', 'planetary'])
-        if any(w in topic_lower for w in ['ocean', 'marine', 'sea', 'coastal', 'fish']):
-            topic_categories.extend(['ocean', 'environment', 'marine'])
-
-        # Get recent publications (last 400 by ID) that might match
-        recent_pubs = sorted(SCRAPED_CATALOG, key=lambda x: int(x.get('id', 0)), reverse=True)[:400]
-
-        for pub in recent_pubs:
-            pub_topics = pub.get('topics', [])
+        topic_categories = _categories_for_topic(topic_lower)
+
+        # Plural-folded long topic words, matched against each pub's
+        # precomputed title token set
+        long_title_words = frozenset(_with_singulars(set(long_topic_words)))
+
+        # Recent publications (last 400 by ID) that might match
+        for pub in RECENT_PUBS:
             # Include if matches a category or has a matching title word
-            if any(cat in pub_topics for cat in topic_categories):
-                candidate_pubs.append(pub)
-            elif any(word in pub.get('title', '').lower() for word in topic_words if len(word) >= 5):
+            if topic_categories & pub['_topics_set'] or long_title_words & pub['_title_tokens_set']:
                 candidate_pubs.append(pub)
 
             if len(candidate_pubs) >= 20:
@@ -383,9 +613,9 @@ def find_publications_for_topic(topic_name, use_llm_fallback=True):
                     llm_breakdown = {'keyword': 0, 'title': 0, 'description': 0, 'recency': 0, 'llm': 3}
                     matches[pub_id] = (3, pub, llm_breakdown)
 
-            # Re-sort and return
-            sorted_matches = sorted(matches.values(), key=lambda x: -x[0])
-            result = [m[1] for m in sorted_matches[:8]]  # Return up to 8 candidates
+            # Re-rank and return
+            sorted_matches = heapq.nlargest(8, matches.values(), key=lambda x: x[0])
+            result = [_public_view(m[1]) for m in sorted_matches]  # Return up to 8 candidates
 
     return result
 
@@ -394,23 +624,23 @@ def find_current_projects_for_topic(topic_name):
     """Find relevant current/in-progress NASEM projects for a topic."""
     topic_lower = topic_name.lower()
     topic_words = set(re.findall(r'\b\w{4,}\b', topic_lower))
+    title_pattern, _ = compile_topic_patterns(topic_words)
     matches = []
 
     for project in CURRENT_PROJECTS:
         title_lower = project.get("title", "").lower()
-        score = 0
 
-        # Check word matches in title
-        for word in topic_words:
-            if re.search(r'\b' + re.escape(word) + r'\b', title_lower):
-                score += 2
+        # Check word matches in title (each distinct word scores once)
+        score = 0
+        if title_pattern is not None:
+            score = 2 * len(set(title_pattern.findall(title_lower)))
 
         if score >= 2:  # At least one significant word match
             matches.append((score, project))
 
-    # Sort and return top matches
-    matches.sort(key=lambda x: -x[0])
-    return [m[1] for m in matches[:3]]  # Return up to 3 current projects
+    # Return top matches
+    top = heapq.nlargest(3, matches, key=lambda x: x[0])
+    return [m[1] for m in top]  # Return up to 3 current projects
 
 
 def match_topics_to_nasem(topics, use_llm_fallback=True):
@@ -433,13 +663,25 @@ def match_topics_to_nasem(topics, use_llm_fallback=True):
         print("  (LLM fallback disabled - using algorithmic matching only)")
     print()
 
-    for topic in topics:
+    # Run the lookups in parallel — the LLM-fallback branch is a network
+    # round-trip per weak topic, so overlapping them cuts batch wall
+    # time (same pool pattern as llm.ask_llm_batch). ex.map preserves
+    # order, so printing and assembly below stay sequential.
+    def _match_one(topic):
         topic_name = re.sub(r"^TOPIC\s*\\d+:\\s*", "", topic.get("topic", "Unknown"))
+        candidates = find_publications_for_topic(topic_name, use_llm_fallback=use_llm_fallback)
+        projects = find_current_projects_for_topic(topic_name)
+        return topic_name, candidates, projects
+
+    if not topics:
+        return topics
+
+    with ThreadPoolExecutor(max_workers=min(8, len(topics))) as executor:
+        lookups = list(executor.map(_match_one, topics))
+
+    for topic, (topic_name, candidates, projects) in zip(topics, lookups):
         topic["topic"] = topic_name
         print(f"  Matching: {topic_name}")
-
-        # Find matching publications
-        candidates = find_publications_for_topic(topic_name, use_llm_fallback=use_llm_fallback)
         print(f"    Publications: {len(candidates)} found")
 
         verified = []
@@ -453,8 +695,6 @@ def match_topics_to_nasem(topics, use_llm_fallback=True):
                 "snippet": ""
             })
 
-        # Find matching current projects
-        projects = find_current_projects_for_topic(topic_name)
         print(f"    Current Projects: {len(projects)} found")
 
         for proj in projects[:2]:  # Take top 2 projects
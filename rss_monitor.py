@@ -3,58 +3,138 @@
 
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import feedparser
-from config import PODCAST_CONFIG_FILE, HISTORY_FILE, EPISODE_LOOKBACK_DAYS
+from config import PODCAST_CONFIG_FILE, HISTORY_FILE, EPISODE_LOOKBACK_DAYS, FEED_CACHE_FILE
+
+# The pipeline only reads titles, GUIDs, dates, and enclosure URLs —
+# episode descriptions go into LLM prompts, never rendered as HTML — so
+# feedparser's per-entry HTML sanitizer and relative-URI resolution are
+# pure overhead on large feeds
+feedparser.SANITIZE_HTML = 0
+feedparser.RESOLVE_RELATIVE_URIS = 0
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path):
+    """Read and parse a JSON file (orjson when available — it's 2-5x faster)."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def load_podcasts():
     """Load podcast configurations."""
-    with open(PODCAST_CONFIG_FILE, 'r') as f:
-        return [p for p in json.load(f) if p.get('active', True)]
+    return [p for p in _load_json(PODCAST_CONFIG_FILE) if p.get('active', True)]
 
 
 def load_history():
     """Load processing history to avoid reprocessing episodes."""
     if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, 'r') as f:
-            return json.load(f)
+        return _load_json(HISTORY_FILE)
     return {"processed_episodes": [], "last_run": None}
 
 
 def save_history(history):
-    """Save processing history."""
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(history, f, indent=2, default=str)
+    """Save processing history (write-then-rename — a truncated history
+    would make every episode look new again)."""
+    tmp_path = HISTORY_FILE + '.tmp'
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(history, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(history, f, indent=2, default=str)
+    os.replace(tmp_path, HISTORY_FILE)
+
 
+def load_feed_cache():
+    """Load per-feed ETag / Last-Modified values for conditional GETs."""
+    if os.path.exists(FEED_CACHE_FILE):
+        try:
+            return _load_json(FEED_CACHE_FILE)
+        except (IOError, ValueError):
+            pass
+    return {}
 
+
+def save_feed_cache(feed_cache):
+    """Persist per-feed conditional-GET validators."""
+    try:
+        os.makedirs(os.path.dirname(FEED_CACHE_FILE), exist_ok=True)
+        with open(FEED_CACHE_FILE, 'w') as f:
+            json.dump(feed_cache, f, indent=2)
+    except IOError as e:
+        print(f"  [WARN] Could not write feed cache: {e}")
+
+
+# feedparser entries are FeedParserDicts: attribute access goes through
+# an exception-driven __getattr__, so plain .get is the cheap path
 def get_episode_guid(entry):
     """Get a unique identifier for an episode."""
-    if hasattr(entry, 'id') and entry.id:
-        return entry.id
-    if hasattr(entry, 'link') and entry.link:
-        return entry.link
-    return entry.get('title', '') + entry.get('published', '')
+    return (entry.get('id') or entry.get('link')
+            or entry.get('title', '') + entry.get('published', ''))
 
 
 def get_audio_url(entry):
     """Extract audio URL from RSS entry enclosures."""
-    if hasattr(entry, 'enclosures') and entry.enclosures:
-        for enc in entry.enclosures:
+    enclosures = entry.get('enclosures')
+    if enclosures:
+        for enc in enclosures:
             if enc.get('type', '').startswith('audio/') or enc.get('href', '').endswith(('.mp3', '.m4a', '.wav')):
                 return enc.get('href', '')
         # Fallback: return first enclosure
-        return entry.enclosures[0].get('href', '')
+        return enclosures[0].get('href', '')
 
     # Some feeds use media:content
-    if hasattr(entry, 'media_content') and entry.media_content:
-        for media in entry.media_content:
-            if media.get('type', '').startswith('audio/'):
-                return media.get('url', '')
+    for media in entry.get('media_content') or ():
+        if media.get('type', '').startswith('audio/'):
+            return media.get('url', '')
 
     return None
 
 
+# Preferred transcript formats, best first — plain text needs no
+# conversion, captions need timestamp stripping, JSON needs reassembly
+_TRANSCRIPT_TYPE_RANK = ['text/plain', 'text/vtt', 'text/srt', 'application/srt', 'application/json']
+
+
+def get_transcript_url(entry):
+    """Extract a publisher transcript URL (Podcasting 2.0
+    <podcast:transcript>) from an RSS entry, if the feed offers one.
+
+    feedparser surfaces the tag in a few shapes depending on how the
+    feed declares the namespace, so check each; returns None when the
+    feed has no usable transcript.
+    """
+    transcripts = entry.get('podcast_transcript') or entry.get('transcript')
+    if not transcripts:
+        return None
+    if isinstance(transcripts, dict):
+        transcripts = [transcripts]
+    if not isinstance(transcripts, list):
+        return None
+
+    best_url, best_rank = None, len(_TRANSCRIPT_TYPE_RANK)
+    for t in transcripts:
+        if not isinstance(t, dict):
+            continue
+        url = t.get('url') or t.get('href')
+        if not url:
+            continue
+        mime = (t.get('type') or '').split(';')[0].strip().lower()
+        rank = _TRANSCRIPT_TYPE_RANK.index(mime) if mime in _TRANSCRIPT_TYPE_RANK else best_rank
+        if best_url is None or rank < best_rank:
+            best_url, best_rank = url, rank
+    return best_url
+
+
 def parse_duration(entry):
     """Try to extract episode duration in minutes."""
     # itunes:duration can be HH:MM:SS, MM:SS, or just seconds
@@ -74,10 +154,51 @@ def parse_duration(entry):
         return None
 
 
-def check_feed(podcast, history, lookback_days=None):
+# Marker returned by fetch_feed for feeds still inside a server-requested
+# rate-limit cooldown
+_COOLDOWN = object()
+
+
+def fetch_feed(podcast, feed_cache=None):
+    """
+    Fetch and parse a podcast's RSS feed — the network half of
+    check_feed, safe to run on a worker thread.
+
+    Returns the parsed feed, the raised Exception on failure, the
+    _COOLDOWN marker while a rate-limited feed's Retry-After window is
+    open, or None when the podcast has no RSS URL.
+    """
+    if not podcast.get('rss_url'):
+        return None
+
+    cached = feed_cache.get(podcast['rss_url'], {}) if feed_cache is not None else {}
+    if cached.get('retry_until', 0) > time.time():
+        return _COOLDOWN
+    try:
+        return feedparser.parse(
+            podcast['rss_url'],
+            etag=cached.get('etag'),
+            modified=cached.get('modified'),
+        )
+    except Exception as e:
+        return e
+
+
+def check_feed(podcast, history, lookback_days=None, feed_cache=None, feed=None,
+               processed_guids=None):
     """
     Check a single podcast's RSS feed for new episodes.
 
+    When feed_cache is given, the fetch is a conditional GET: the feed's
+    stored ETag / Last-Modified values are sent along, a 304 answer
+    skips the download and parse entirely, and fresh validators are
+    written back into the dict.
+
+    check_all_feeds pre-fetches feeds on a thread pool and passes them
+    in via `feed`; when it is None the fetch happens here. It also
+    passes the processed-GUID set via `processed_guids` so the history
+    list is turned into a set once per run, not once per feed.
+
     Returns list of new episode dicts.
     """
     if lookback_days is None:
@@ -89,17 +210,47 @@ def check_feed(podcast, history, lookback_days=None):
 
     print(f"  Checking {podcast['name']}...")
 
-    try:
-        feed = feedparser.parse(podcast['rss_url'])
-    except Exception as e:
-        print(f"  [ERROR] {podcast['name']}: Failed to parse feed: {e}")
+    if feed is None:
+        feed = fetch_feed(podcast, feed_cache)
+    if feed is _COOLDOWN:
+        print(f"  [SKIP] {podcast['name']}: Rate-limit cooldown in effect")
+        return []
+    if isinstance(feed, Exception):
+        print(f"  [ERROR] {podcast['name']}: Failed to parse feed: {feed}")
+        return []
+
+    status = getattr(feed, 'status', None)
+    if status == 304:
+        print(f"  [--] {podcast['name']}: Not modified")
+        return []
+
+    # Server asked us to back off — honor Retry-After (default 15 min)
+    # so the next run doesn't hammer a struggling host
+    if status in (429, 503):
+        headers = getattr(feed, 'headers', None) or {}
+        try:
+            retry_after = float(headers.get('retry-after', 0))
+        except (TypeError, ValueError):
+            retry_after = 0
+        if feed_cache is not None:
+            entry = dict(feed_cache.get(podcast['rss_url'], {}))
+            entry['retry_until'] = time.time() + max(retry_after, 900)
+            feed_cache[podcast['rss_url']] = entry
+        print(f"  [WARN] {podcast['name']}: Server busy (HTTP {status}), backing off")
         return []
 
+    if feed_cache is not None:
+        etag = getattr(feed, 'etag', None)
+        modified = getattr(feed, 'modified', None)
+        if etag or modified:
+            feed_cache[podcast['rss_url']] = {'etag': etag, 'modified': modified}
+
     if feed.bozo and not feed.entries:
         print(f"  [ERROR] {podcast['name']}: Malformed feed")
         return []
 
-    processed_guids = set(history.get('processed_episodes', []))
+    if processed_guids is None:
+        processed_guids = set(history.get('processed_episodes', []))
     cutoff = datetime.now() - timedelta(days=lookback_days)
     new_episodes = []
 
@@ -112,9 +263,10 @@ def check_feed(podcast, history, lookback_days=None):
 
         # Parse publish date
         published = None
-        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        published_parsed = entry.get('published_parsed')
+        if published_parsed:
             try:
-                published = datetime(*entry.published_parsed[:6])
+                published = datetime(*published_parsed[:6])
             except (TypeError, ValueError):
                 pass
 
@@ -135,7 +287,8 @@ def check_feed(podcast, history, lookback_days=None):
             'description': entry.get('summary', entry.get('description', '')),
             'published': published.isoformat() if published else None,
             'audio_url': audio_url,
-            'episode_url': getattr(entry, 'link', '') or '',
+            'transcript_url': get_transcript_url(entry),
+            'episode_url': entry.get('link') or '',
             'duration_minutes': parse_duration(entry),
             'influence_tier': podcast.get('influence_tier', 'emerging'),
             'category': podcast.get('category', ''),
@@ -158,14 +311,28 @@ def check_all_feeds(lookback_days=None):
     """
     podcasts = load_podcasts()
     history = load_history()
+    feed_cache = load_feed_cache()
+    cache_before = dict(feed_cache)
 
     print(f"\n[RSS] Checking {len(podcasts)} podcast feeds...")
     all_new = []
 
-    for podcast in podcasts:
-        episodes = check_feed(podcast, history, lookback_days)
+    # Fetch every feed concurrently (pure network wait), then filter
+    # serially so per-feed output and cache writes stay in order
+    feeds = []
+    if podcasts:
+        with ThreadPoolExecutor(max_workers=min(16, len(podcasts))) as executor:
+            feeds = list(executor.map(lambda p: fetch_feed(p, feed_cache), podcasts))
+
+    processed_guids = set(history.get('processed_episodes', []))
+    for podcast, feed in zip(podcasts, feeds):
+        episodes = check_feed(podcast, history, lookback_days, feed_cache=feed_cache,
+                              feed=feed, processed_guids=processed_guids)
         all_new.extend(episodes)
 
+    if feed_cache != cache_before:
+        save_feed_cache(feed_cache)
+
     print(f"\n[RSS] Found {len(all_new)} new episode(s) total")
     return all_new
 
@@ -1,9 +1,58 @@
 # summarizer.py
 # LLM summarization of podcast transcripts
 
+import hashlib
 import json
+import os
+import threading
+import time
+
+from config import SUMMARY_CACHE_FILE, SUMMARY_CACHE_TTL_HOURS
 from llm import ask_llm
 
+# Transcript-keyed summary cache, loaded on first use. The LLM cache in
+# llm.py only hits on byte-identical prompts, which include episode
+# metadata — this tier keys on SHA256 of the transcript text alone, so
+# a re-run where the title or date changed still skips the API call.
+_SUMMARY_CACHE = {'loaded': False, 'entries': {}}
+
+# Serializes cache-file writes when episodes summarize on several threads
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+
+def _summary_cache_get(key):
+    if not _SUMMARY_CACHE['loaded']:
+        _SUMMARY_CACHE['loaded'] = True
+        try:
+            with open(SUMMARY_CACHE_FILE, 'r') as f:
+                _SUMMARY_CACHE['entries'] = json.load(f)
+        except (IOError, ValueError):
+            _SUMMARY_CACHE['entries'] = {}
+
+    entry = _SUMMARY_CACHE['entries'].get(key)
+    if entry is None:
+        return None
+    if time.time() - entry.get('timestamp', 0) > SUMMARY_CACHE_TTL_HOURS * 3600:
+        return None
+    return entry.get('summary')
+
+
+def _summary_cache_put(key, summary):
+    now = time.time()
+    with _SUMMARY_CACHE_LOCK:
+        entries = _SUMMARY_CACHE['entries']
+        entries[key] = {'summary': summary, 'timestamp': now}
+        cutoff = now - SUMMARY_CACHE_TTL_HOURS * 3600
+        stale = [k for k, e in entries.items() if e.get('timestamp', 0) < cutoff]
+        for k in stale:
+            del entries[k]
+        try:
+            os.makedirs(os.path.dirname(SUMMARY_CACHE_FILE), exist_ok=True)
+            with open(SUMMARY_CACHE_FILE, 'w') as f:
+                json.dump(entries, f)
+        except IOError as e:
+            print(f"  [WARN] Could not write summary cache: {e}")
+
 
 PODCAST_SYSTEM_PROMPT = """You are a science policy analyst at the National Academies of Sciences, \
 Engineering, and Medicine (NASEM). Your job is to analyze podcast transcripts and \
@@ -53,6 +102,14 @@ def summarize_episode(transcript):
     if len(text) > max_chars:
         text = text[:max_chars] + "\n\n[TRANSCRIPT TRUNCATED]"
 
+    cache_key = hashlib.sha256(text.encode()).hexdigest()
+    cached = _summary_cache_get(cache_key)
+    if cached is not None:
+        print(f"  [CACHE] Reusing stored summary for this transcript")
+        summary = dict(cached)
+        _attach_metadata(summary, transcript)
+        return summary
+
     prompt = PODCAST_USER_PROMPT.format(
         podcast_name=podcast_name,
         episode_title=episode_title,
@@ -74,6 +131,9 @@ def summarize_episode(transcript):
         cleaned = cleaned.strip()
 
         summary = json.loads(cleaned)
+        # Cache only the LLM-derived fields (before metadata attach), and
+        # never a parse-error fallback
+        _summary_cache_put(cache_key, dict(summary))
     except json.JSONDecodeError:
         print(f"  [WARN] Failed to parse LLM response as JSON, using raw text")
         summary = {
@@ -85,10 +145,20 @@ def summarize_episode(transcript):
             "parse_error": True,
         }
 
-    # Attach episode metadata
+    _attach_metadata(summary, transcript)
+
+    topic_count = len(summary.get('science_topics', []))
+    print(f"  Extracted {topic_count} science topics")
+
+    return summary
+
+
+def _attach_metadata(summary, transcript):
+    """Attach episode metadata to a summary (fresh on every call, so
+    cached summaries pick up the current episode's details)."""
     summary['podcast_id'] = transcript.get('podcast_id', '')
-    summary['podcast_name'] = podcast_name
-    summary['episode_title'] = episode_title
+    summary['podcast_name'] = transcript.get('podcast_name', 'Unknown')
+    summary['episode_title'] = transcript.get('episode_title', 'Untitled')
     summary['host'] = transcript.get('host', '')
     summary['published'] = transcript.get('published', '')
     summary['duration_minutes'] = transcript.get('duration_minutes')
@@ -97,11 +167,6 @@ def summarize_episode(transcript):
     summary['episode_url'] = transcript.get('episode_url', '')
     summary['word_count'] = transcript.get('word_count', 0)
 
-    topic_count = len(summary.get('science_topics', []))
-    print(f"  Extracted {topic_count} science topics")
-
-    return summary
-
 
 if __name__ == '__main__':
     # Test with a sample transcript
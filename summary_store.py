@@ -4,16 +4,36 @@
 import os
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 SUMMARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'summaries')
 
+# Parsed-summary index — caches each file's record keyed by mtime so
+# steady-state runs only re-parse files that actually changed
+SUMMARY_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'summaries_index.json')
+
+# Summary files are small, so loading is dominated by per-file open/read
+# latency; a modest thread pool overlaps that I/O
+_LOAD_WORKERS = 8
+
+
+# Hoisted so per-call cost is two compiled-pattern subs, not two
+# pattern-cache lookups
+_FILENAME_STRIP_RE = re.compile(r'[^\w\s-]')
+_FILENAME_WS_RE = re.compile(r'\s+')
+
 
 def _safe_filename(s, max_len=50):
     """Convert a string to a safe filename fragment."""
-    s = re.sub(r'[^\w\s-]', '', s.lower())
-    s = re.sub(r'[\s]+', '_', s.strip())
+    s = _FILENAME_STRIP_RE.sub('', s.lower())
+    s = _FILENAME_WS_RE.sub('_', s.strip())
     return s[:max_len]
 
 
@@ -65,62 +85,126 @@ def save_summary(summary):
         'saved_at': datetime.now().isoformat(),
     }
 
+    # Write-then-rename so a crash mid-write never leaves a truncated
+    # summary for load_all_summaries to choke on
     filepath = _get_summary_path(summary)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(stored, f, indent=2, ensure_ascii=False)
+    tmp_path = filepath + '.tmp'
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(stored, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, filepath)
 
     print(f"  [STORE] Saved summary: {os.path.basename(filepath)}")
     return filepath
 
 
+def _read_summary_file(filename):
+    """Read and parse one summary JSON; returns None on failure."""
+    filepath = os.path.join(SUMMARY_DIR, filename)
+    try:
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        data['_filename'] = filename
+        return data
+    except (ValueError, IOError) as e:
+        print(f"  [WARN] Failed to load {filename}: {e}")
+        return None
+
+
+def _load_summary_index():
+    """Load the filename -> [mtime, record] index; empty dict on failure."""
+    try:
+        with open(SUMMARY_INDEX_FILE, 'rb') as f:
+            raw = f.read()
+        index = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return index if isinstance(index, dict) else {}
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_summary_index(index):
+    """Persist the parsed-summary index; failures are non-fatal."""
+    try:
+        tmp_path = SUMMARY_INDEX_FILE + '.tmp'
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(index))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp_path, SUMMARY_INDEX_FILE)
+    except IOError as e:
+        print(f"  [WARN] Could not write summary index: {e}")
+
+
 def load_all_summaries():
     """
     Load all stored summaries from disk.
 
+    An on-disk index caches each file's parsed record keyed by mtime, so
+    only files added or touched since the last run are re-parsed — a
+    steady-state daily run reads one index file instead of the whole
+    history.
+
     Returns:
         list of summary dicts, sorted by published date (newest first)
     """
     if not os.path.exists(SUMMARY_DIR):
         return []
 
+    # One scandir pass yields names and mtimes together
+    mtimes = {}
+    with os.scandir(SUMMARY_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.json') and entry.is_file():
+                mtimes[entry.name] = entry.stat().st_mtime
+
+    index = _load_summary_index()
     summaries = []
-    for filename in os.listdir(SUMMARY_DIR):
-        if not filename.endswith('.json'):
-            continue
-        filepath = os.path.join(SUMMARY_DIR, filename)
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                data['_filename'] = filename
-                summaries.append(data)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"  [WARN] Failed to load {filename}: {e}")
-
-    # Sort by published date (newest first)
-    def sort_key(s):
-        try:
-            return datetime.fromisoformat(s.get('published', ''))
-        except (ValueError, TypeError):
-            return datetime.min
-
-    summaries.sort(key=sort_key, reverse=True)
+    stale = []
+    for filename, mtime in mtimes.items():
+        cached = index.get(filename)
+        if cached and cached[0] == mtime:
+            summaries.append(cached[1])
+        else:
+            stale.append(filename)
+
+    if len(stale) > 1:
+        with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as executor:
+            loaded = list(executor.map(_read_summary_file, stale))
+    else:
+        loaded = [_read_summary_file(f) for f in stale]
+
+    index_dirty = len(index) != len(mtimes)
+    for filename, record in zip(stale, loaded):
+        if record is not None:
+            summaries.append(record)
+            index[filename] = [mtimes[filename], record]
+            index_dirty = True
+
+    if index_dirty:
+        # Drop deleted files so the index tracks the directory exactly
+        index = {f: v for f, v in index.items() if f in mtimes}
+        _save_summary_index(index)
+
+    # Sort by published date (newest first) — isoformat() output orders
+    # lexicographically, so plain string compare beats N datetime parses
+    summaries.sort(key=lambda s: s.get('published') or '', reverse=True)
     return summaries
 
 
 def load_recent_summaries(days=90):
     """Load summaries from the last N days."""
     from datetime import timedelta
-    cutoff = datetime.now() - timedelta(days=days)
-
-    all_summaries = load_all_summaries()
-    recent = []
-    for s in all_summaries:
-        try:
-            pub_date = datetime.fromisoformat(s.get('published', ''))
-            if pub_date >= cutoff:
-                recent.append(s)
-        except (ValueError, TypeError):
-            # Include if we can't parse the date (better to include than exclude)
-            recent.append(s)
-
-    return recent
+    cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
+
+    # ISO strings compare correctly without parsing; summaries with no
+    # date are kept (better to include than exclude)
+    return [
+        s for s in load_all_summaries()
+        if not s.get('published') or s['published'] >= cutoff_iso
+    ]
@@ -4,7 +4,14 @@
 
 import os
 import json
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 TIMELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'topic_timeline.json')
@@ -57,27 +64,64 @@ SYNONYMS = {
 }
 
 
+# Memoized — the same topic strings recur across every summary and every
+# daily run, so repeat lookups skip the lower/strip work entirely
+@lru_cache(maxsize=4096)
 def normalize_topic(topic):
     """Normalize a topic name using synonym map and lowercasing."""
     lower = topic.lower().strip()
     return SYNONYMS.get(lower, topic.strip())
 
 
+# All synonym keys fused into one alternation so free text is scanned in
+# a single compiled pass instead of one search per key; longest keys
+# first so 'crispr-cas9' wins over 'crispr'
+_SYNONYM_SCAN_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in sorted(SYNONYMS, key=len, reverse=True)) + r')\b'
+)
+
+
+def extract_canonical_topics(text):
+    """Find synonym-map topics mentioned in free text (e.g. a summary).
+
+    Returns canonical topic names, deduplicated, in order of first
+    appearance.
+    """
+    if not text:
+        return []
+    seen = set()
+    topics = []
+    for match in _SYNONYM_SCAN_RE.finditer(text.lower()):
+        canonical = SYNONYMS[match.group(0)]
+        if canonical not in seen:
+            seen.add(canonical)
+            topics.append(canonical)
+    return topics
+
+
 def load_timeline():
-    """Load existing topic timeline from disk."""
+    """Load existing topic timeline from disk (orjson when available)."""
     if os.path.exists(TIMELINE_FILE):
         try:
-            with open(TIMELINE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(TIMELINE_FILE, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, IOError):
             pass
     return {}
 
 
 def save_timeline(timeline):
-    """Save topic timeline to disk."""
-    with open(TIMELINE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(timeline, f, indent=2, ensure_ascii=False)
+    """Save topic timeline to disk (write-then-rename, so a crash
+    mid-write never leaves a truncated timeline behind)."""
+    tmp_path = TIMELINE_FILE + '.tmp'
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(timeline, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(timeline, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, TIMELINE_FILE)
 
 
 def record_podcast_topics(summaries):
@@ -97,7 +141,15 @@ def record_podcast_topics(summaries):
         published = summary.get('published', datetime.now().isoformat())
         episode_title = summary.get('episode_title', '')
 
-        for topic in summary.get('science_topics', []):
+        # LLM-extracted topics plus synonym-map hits from the summary
+        # text itself — catches tracked topics the LLM phrased differently
+        topics = list(summary.get('science_topics', []))
+        known = {normalize_topic(t).lower() for t in topics}
+        for canonical in extract_canonical_topics(summary.get('summary', '')):
+            if canonical.lower() not in known:
+                topics.append(canonical)
+
+        for topic in topics:
             canonical = normalize_topic(topic)
             key = canonical.lower()
 
@@ -211,8 +263,13 @@ def get_cross_channel_topics(days=14):
         # Filter to channels with recent activity
         recent_channels = {}
         for ch_key, ch_data in data.get('channels', {}).items():
+            mentions = ch_data.get('mentions', [])
+            # Mentions are appended in run order, so a stale newest
+            # mention means the whole channel is stale — skip the scan
+            if not mentions or mentions[-1].get('date', '') < cutoff:
+                continue
             recent_mentions = [
-                m for m in ch_data.get('mentions', [])
+                m for m in mentions
                 if m.get('date', '') >= cutoff
             ]
             if recent_mentions:
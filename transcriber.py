@@ -4,11 +4,19 @@
 import os
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import requests
 from openai import OpenAI, RateLimitError
 from config import GROQ_API_KEY, TRANSCRIPTION_MODEL, TRANSCRIPT_DIR
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_groq_client():
     """Get Groq client (OpenAI-compatible)."""
@@ -31,6 +39,25 @@ def _parse_retry_seconds(error_message):
     return 120  # Default 2 min wait if can't parse
 
 
+# Space API request starts ~4s apart (15 RPM) to stay under Groq's 20 RPM
+# free-tier limit even when chunks are transcribed concurrently — workers
+# overlap the long upload/processing round-trips, but starts stay paced
+_PACE_SECONDS = 4
+_pace_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _pace_request():
+    """Block until the next shared API request slot."""
+    global _next_request_at
+    with _pace_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + _PACE_SECONDS
+    if wait > 0:
+        time.sleep(wait)
+
+
 def transcribe_file(audio_path, max_retries=3):
     """
     Transcribe a single audio file using Groq Whisper API.
@@ -42,6 +69,7 @@ def transcribe_file(audio_path, max_retries=3):
 
     for attempt in range(max_retries):
         try:
+            _pace_request()
             with open(audio_path, "rb") as audio_file:
                 transcript = client.audio.transcriptions.create(
                     model=TRANSCRIPTION_MODEL,
@@ -70,19 +98,106 @@ def transcribe_chunks(chunk_paths):
     if len(chunk_paths) == 1:
         return transcribe_file(chunk_paths[0])
 
-    print(f"  Transcribing {len(chunk_paths)} chunks...")
-    parts = []
-    for i, path in enumerate(chunk_paths):
-        print(f"    Chunk {i+1}/{len(chunk_paths)}...")
-        text = transcribe_file(path)
-        parts.append(text)
-        # Pace requests to stay under Groq's 20 RPM free-tier limit
-        if i < len(chunk_paths) - 1:
-            time.sleep(4)
+    # Chunks are independent network calls, so run them on a small thread
+    # pool; executor.map keeps the parts in chunk order, and _pace_request
+    # keeps concurrent starts under the rate limit
+    print(f"  Transcribing {len(chunk_paths)} chunks ({min(4, len(chunk_paths))} in flight)...")
+    with ThreadPoolExecutor(max_workers=min(4, len(chunk_paths))) as executor:
+        parts = list(executor.map(transcribe_file, chunk_paths))
 
     return "\n\n".join(parts)
 
 
+# Matches VTT (00:00:01.000) and SRT (00:00:01,000) cue timing lines
+_CUE_TIMING_RE = re.compile(r'-->')
+_CAPTION_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _captions_to_text(raw):
+    """Flatten a VTT or SRT caption file to plain transcript text."""
+    lines = []
+    prev = None
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line or line == 'WEBVTT' or line.startswith(('NOTE', 'STYLE', 'REGION')):
+            continue
+        if _CUE_TIMING_RE.search(line):
+            continue
+        if line.isdigit():  # SRT cue numbers
+            continue
+        line = _CAPTION_TAG_RE.sub('', line)
+        # Rolling captions repeat the same line across cues
+        if line and line != prev:
+            lines.append(line)
+            prev = line
+    return ' '.join(lines)
+
+
+def fetch_external_transcript(episode):
+    """
+    Fetch a publisher-provided transcript (Podcasting 2.0
+    <podcast:transcript> tag) instead of downloading and transcribing
+    the audio.
+
+    Returns the same transcript dict shape as transcribe_episode, or
+    None when the transcript is missing, unfetchable, or too short to
+    trust (caller falls back to the audio path).
+    """
+    url = episode.get('transcript_url')
+    if not url:
+        return None
+
+    print(f"  Fetching publisher transcript...")
+    try:
+        # Browser User-Agent: some CDNs (e.g. Acast) reject default clients
+        response = requests.get(url, timeout=60, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+        })
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"  [WARN] Transcript fetch failed: {e}")
+        return None
+
+    body = response.text
+    content_type = response.headers.get('content-type', '').lower()
+    if 'json' in content_type or body.lstrip().startswith('{'):
+        try:
+            data = json.loads(body)
+            segments = data.get('segments', []) if isinstance(data, dict) else []
+            text = ' '.join(s.get('body', '').strip() for s in segments if isinstance(s, dict))
+        except ValueError:
+            text = ''
+    elif body.lstrip().startswith('WEBVTT') or '-->' in body[:2000]:
+        text = _captions_to_text(body)
+    else:
+        text = body.strip()
+
+    word_count = len(text.split())
+    if word_count < 100:
+        print(f"  [WARN] Publisher transcript unusable ({word_count} words), falling back to audio")
+        return None
+
+    print(f"  Fetched transcript: {word_count:,} words")
+
+    transcript = {
+        'podcast_id': episode.get('podcast_id', ''),
+        'podcast_name': episode.get('podcast_name', 'Unknown'),
+        'episode_title': episode.get('title', 'Untitled'),
+        'host': episode.get('host', ''),
+        'published': episode.get('published', ''),
+        'duration_minutes': episode.get('duration_minutes'),
+        'influence_tier': episode.get('influence_tier', 'emerging'),
+        'category': episode.get('category', ''),
+        'episode_url': episode.get('episode_url', ''),
+        'transcript': text,
+        'word_count': word_count,
+        'transcribed_at': datetime.now().isoformat(),
+        'model': 'publisher-transcript',
+    }
+    save_transcript(transcript, episode)
+    return transcript
+
+
 def transcribe_episode(audio_paths, episode):
     """
     Transcribe an episode and save the transcript.
@@ -136,14 +251,26 @@ def save_transcript(transcript, episode):
     filename = f"{podcast_id}_{date_str}_{_safe_filename(episode.get('title', 'untitled'))}.json"
     filepath = os.path.join(TRANSCRIPT_DIR, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(transcript, f, indent=2, ensure_ascii=False)
+    # Transcripts run to hundreds of KB of text; orjson skips the
+    # pure-Python serializer when available
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(transcript, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(transcript, f, indent=2, ensure_ascii=False)
 
     print(f"  Saved transcript: {filename}")
 
 
+# Hoisted so per-call cost is two compiled-pattern subs, not two
+# pattern-cache lookups
+_FILENAME_STRIP_RE = re.compile(r'[^\w\s-]')
+_FILENAME_WS_RE = re.compile(r'\s+')
+
+
 def _safe_filename(s, max_len=50):
     """Convert string to safe filename."""
-    s = re.sub(r'[^\w\s-]', '', s)
-    s = re.sub(r'\s+', '_', s)
+    s = _FILENAME_STRIP_RE.sub('', s)
+    s = _FILENAME_WS_RE.sub('_', s)
     return s[:max_len].strip('_').lower()
@@ -5,11 +5,38 @@ import os
 import json
 import glob
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from config import DIGEST_INFO_CACHE_FILE
 
 
-def get_digest_info(filepath):
-    """Extract info from a digest file."""
+def _load_digest_cache():
+    """Load the filename-keyed digest info cache; empty dict on failure."""
+    try:
+        with open(DIGEST_INFO_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_digest_cache(cache):
+    """Persist the digest info cache; failures are non-fatal."""
+    try:
+        os.makedirs(os.path.dirname(DIGEST_INFO_CACHE_FILE), exist_ok=True)
+        with open(DIGEST_INFO_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except IOError as e:
+        print(f"  [WARN] Could not write digest cache: {e}")
+
+
+def get_digest_info(filepath, cache=None):
+    """Extract info from a digest file.
+
+    When a cache dict is given, a file whose mtime matches the cached
+    entry skips the episode-count scan entirely — digests are
+    write-once, so this is the steady-state path for all but today's.
+    """
     filename = os.path.basename(filepath)
 
     # Extract date from filename (digest_YYYYMMDD_HHMM.html)
@@ -17,6 +44,11 @@ def get_digest_info(filepath):
     if not match:
         return None
 
+    mtime = os.path.getmtime(filepath)
+    cached = cache.get(filename) if cache is not None else None
+    if cached and cached.get('mtime') == mtime:
+        return dict(cached)
+
     date_str = match.group(1)
     time_str = match.group(2)
 
@@ -27,24 +59,33 @@ def get_digest_info(filepath):
         formatted_date = date_str
         dt = None
 
-    # Count episodes by looking for "episode" divs in the file
+    # Count episodes by looking for "episode" divs in the file.
+    # Counted in 64 KiB byte chunks — no UTF-8 decode, no whole-file
+    # allocation. The marker straddling a chunk boundary is handled by
+    # carrying the last len(marker)-1 bytes into the next chunk.
+    marker = b'class="episode"'
     episode_count = 0
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            episode_count = content.count('class="episode"')
+        with open(filepath, 'rb') as f:
+            tail = b''
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                buf = tail + chunk
+                episode_count += buf.count(marker)
+                tail = buf[-(len(marker) - 1):]
     except Exception:
         pass
 
-    mtime = os.path.getmtime(filepath)
-
-    return {
+    info = {
         'file': filename,
         'date': formatted_date,
         'timestamp': dt.isoformat() if dt else date_str,
         'mtime': mtime,
         'episodes': episode_count
     }
+    if cache is not None:
+        # Store a copy — update_manifest strips mtime from its list
+        cache[filename] = dict(info)
+    return info
 
 
 def update_manifest():
@@ -54,11 +95,24 @@ def update_manifest():
     pattern = os.path.join(script_dir, 'digest_*.html')
     digest_files = glob.glob(pattern)
 
-    digests = []
-    for filepath in digest_files:
-        info = get_digest_info(filepath)
-        if info:
-            digests.append(info)
+    cache = _load_digest_cache()
+    cache_before = dict(cache)
+
+    # Reads are independent file I/O, so overlap them on a small pool;
+    # cache-hit entries return without touching the file at all, and
+    # each worker writes a distinct cache key
+    if len(digest_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(digest_files))) as executor:
+            infos = list(executor.map(lambda p: get_digest_info(p, cache=cache), digest_files))
+    else:
+        infos = [get_digest_info(p, cache=cache) for p in digest_files]
+    digests = [info for info in infos if info]
+
+    # Prune deleted digests and persist only if something changed
+    current = {os.path.basename(p) for p in digest_files}
+    cache = {f: v for f, v in cache.items() if f in current}
+    if cache != cache_before:
+        _save_digest_cache(cache)
 
     # Sort by parsed timestamp (newest first)
     digests.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
@@ -75,9 +129,13 @@ def update_manifest():
         'digests': digests
     }
 
+    # Write-then-rename — the manifest is fetched by the live site, so
+    # it must never be visible half-written
     manifest_path = os.path.join(script_dir, 'digest_manifest.json')
-    with open(manifest_path, 'w', encoding='utf-8') as f:
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
         json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
 
     print(f"Updated manifest with {len(digests)} digests")
     for d in digests[:3]: